@@ -0,0 +1,96 @@
+# -------------------------------------------------
+# Array backed disjoint set (union-find).
+#
+# __copyright__ = 'Copyright 2024, RMIT University'
+# -------------------------------------------------
+
+
+from array import array
+
+
+class DisjointSet:
+    """
+    Disjoint set over the integers 0 to size-1, with path compression and union by rank.
+    The parents and ranks are stored in flat arrays, so a set over millions of elements stays compact, and
+    merging two structures built over separate ranges of elements only needs their arrays.
+    """
+
+    def __init__(self, size: int):
+        """
+        Constructor.  Each element starts in a set of its own.
+
+        @param size: Number of elements.
+        """
+        # self.m_parent: parent of each element, roots are their own parent.
+        self.m_parent: array = array('l', range(size))
+        # self.m_rank: upper bound on the height of the tree below each root.  Fits in a byte, as ranks are at
+        # most log2(size).
+        self.m_rank: bytearray = bytearray(size)
+        # self.m_setNum: number of disjoint sets.
+        self.m_setNum: int = size
+
+
+
+    def find(self, element: int)->int:
+        """
+        @param element: Element to find the set of.
+
+        @returns Root element of the set containing element.
+        """
+        parent: array = self.m_parent
+
+        root: int = element
+        while parent[root] != root:
+            root = parent[root]
+
+        # path compression, point everything on the path straight at the root
+        while parent[element] != root:
+            parent[element], element = root, parent[element]
+
+        return root
+
+
+
+    def union(self, element1: int, element2: int)->bool:
+        """
+        Merges the sets containing element1 and element2.
+
+        @param element1: Element of the first set.
+        @param element2: Element of the second set.
+
+        @returns True if the sets were merged, False if the elements were already in the same set.
+        """
+        root1: int = self.find(element1)
+        root2: int = self.find(element2)
+        if root1 == root2:
+            return False
+
+        # union by rank, attach the shorter tree under the taller one
+        rank = self.m_rank
+        if rank[root1] < rank[root2]:
+            root1, root2 = root2, root1
+        self.m_parent[root2] = root1
+        if rank[root1] == rank[root2]:
+            rank[root1] += 1
+        self.m_setNum -= 1
+
+        return True
+
+
+
+    def connected(self, element1: int, element2: int)->bool:
+        """
+        @param element1: First element.
+        @param element2: Second element.
+
+        @returns True if element1 and element2 are in the same set.
+        """
+        return self.find(element1) == self.find(element2)
+
+
+
+    def setNum(self)->int:
+        """
+        @returns Number of disjoint sets.
+        """
+        return self.m_setNum
@@ -0,0 +1,148 @@
+# -------------------------------------------------------------------
+# Eller's maze generator, generating levels one row at a time.
+#
+# __copyright__ = 'Copyright 2024, RMIT University'
+# -------------------------------------------------------------------
+
+from typing import Callable, Iterator, Tuple
+
+from maze.maze3D import Maze3D
+from maze.util import Coordinates3D
+from generation.mazeGenerator import MazeGenerator
+from generation.disjointSet import DisjointSet
+
+
+
+
+class EllerMazeGenerator(MazeGenerator):
+	"""
+	Eller's maze generator.  Each level is generated row by row, and only the set labels of the current row are
+	kept, so working memory is proportional to the width of a level rather than the number of cells.
+
+	Within a row, adjacent cells in different sets are randomly joined, then every set is carried up to the next
+	row through at least one passage north.  The last row joins all remaining sets.  Each level is then a perfect
+	maze, and adjacent levels are joined by exactly one passage, at a random cell both levels have, so the whole 3D
+	maze is perfect too.
+
+	The rows can be streamed with rows() or writeRows(), e.g., to write them to a file, without building a Maze3D.
+	"""
+
+	# Probability of joining two adjacent cells in different sets, and of a cell having a passage north.
+	JOIN_PROBABILITY = 0.5
+	NORTH_PROBABILITY = 0.5
+
+
+
+	def steps(self, maze: Maze3D):
+		for (level, row, eastOpen, northOpen, upCol) in self.rows(maze.m_levelDims):
+			for col in range(len(eastOpen)):
+				if eastOpen[col]:
+					yield (self.WALL_REMOVED, Coordinates3D(level, row, col), Coordinates3D(level, row, col+1))
+				if northOpen[col]:
+					yield (self.WALL_REMOVED, Coordinates3D(level, row, col), Coordinates3D(level, row+1, col))
+			if upCol >= 0:
+				yield (self.WALL_REMOVED, Coordinates3D(level, row, upCol), Coordinates3D(level+1, row, upCol))
+
+
+
+	def rows(self, levelDims: list[tuple[int, int]])->Iterator[Tuple[int, int, bytearray, bytearray, int]]:
+		"""
+		Generates a 3D maze one row at a time, starting at row 0 of level 0.
+
+		@param levelDims: (rowNum, colNum) of each level, as for Maze3D.  The rowNum of the last level can be None,
+			for an unbounded level whose rows keep coming until the consumer stops iterating.
+
+		@returns Iterator of (level, row, eastOpen, northOpen, upCol) for every row, where eastOpen[col] and
+			northOpen[col] are 1 if there is a passage from cell (level, row, col) to its east or north neighbour
+			respectively, and upCol is the column of the passage up to level+1 in this row, or -1 if there is none.
+
+		@raises ValueError: If a level other than the last is unbounded, as the levels after it would never be
+			reached.
+		"""
+		levelNum : int = len(levelDims)
+		if any([rowNum is None for (rowNum, _) in levelDims[:-1]]):
+			raise ValueError('Only the last level of an Eller maze can be unbounded.')
+		rng = self.rng()
+
+		# choose the passage between each pair of adjacent levels up front, at a cell both levels have
+		upPassages : list[tuple[int, int]] = list()
+		for level in range(levelNum - 1):
+			(rowNum, colNum) = levelDims[level]
+			(upperRowNum, upperColNum) = levelDims[level+1]
+			sharedRowNum : int = rowNum if upperRowNum is None else min(rowNum, upperRowNum)
+			upPassages.append((rng.randint(0, sharedRowNum - 1),
+							   rng.randint(0, min(colNum, upperColNum) - 1)))
+
+		for (level, (rowNum, colNum)) in enumerate(levelDims):
+			(upRow, upCol) = upPassages[level] if level < levelNum - 1 else (-1, -1)
+			for (row, (eastOpen, northOpen)) in enumerate(self.levelRows(rowNum, colNum)):
+				yield (level, row, eastOpen, northOpen, upCol if row == upRow else -1)
+
+
+
+	def writeRows(self, levelDims: list[tuple[int, int]], sink: Callable[[int, int, bytearray, bytearray, int], bool]):
+		"""
+		Generates a 3D maze one row at a time, passing each row to sink rather than storing it.
+
+		@param levelDims: (rowNum, colNum) of each level, as for rows(), so the last level can be unbounded.
+		@param sink: Called with (level, row, eastOpen, northOpen, upCol) for every row, see rows().  Generation
+			stops once it returns False, which is the only way an unbounded level ends.  Returning None carries on.
+		"""
+		for rowInfo in self.rows(levelDims):
+			if sink(*rowInfo) is False:
+				return
+
+
+
+	def levelRows(self, rowNum: int, colNum: int)->Iterator[Tuple[bytearray, bytearray]]:
+		"""
+		Generates a single level one row at a time.
+
+		@param rowNum: Number of rows of the level, or None for an unbounded level, which never has a last row.
+		@param colNum: Number of columns of the level.
+
+		@returns Iterator of (eastOpen, northOpen) for every row, see rows().
+		"""
+		rng = self.rng()
+
+		# set label of each cell of the current row, labels are in range(colNum)
+		labels : list[int] = list(range(colNum))
+
+		row : int = 0
+		while rowNum is None or row < rowNum:
+			lastRow : bool = rowNum is not None and row == rowNum - 1
+			eastOpen : bytearray = bytearray(colNum)
+			northOpen : bytearray = bytearray(colNum)
+
+			# randomly join adjacent cells in different sets, or all of them in the last row
+			sets : DisjointSet = DisjointSet(colNum)
+			for col in range(colNum - 1):
+				if (lastRow or rng.random() < self.JOIN_PROBABILITY) and sets.union(labels[col], labels[col+1]):
+					eastOpen[col] = 1
+
+			if not lastRow:
+				# group the cells of the row by set
+				members : dict[int, list[int]] = dict()
+				for col in range(colNum):
+					members.setdefault(sets.find(labels[col]), list()).append(col)
+
+				# carry every set to the next row through at least one passage north, the rest of the next row
+				# starts in new sets
+				nextLabels : list[int] = [-1] * colNum
+				nextLabel : int = 0
+				for cols in members.values():
+					opened : list[int] = [col for col in cols if rng.random() < self.NORTH_PROBABILITY]
+					if not opened:
+						opened = [rng.choice(cols)]
+					for col in opened:
+						northOpen[col] = 1
+						nextLabels[col] = nextLabel
+					nextLabel += 1
+				for col in range(colNum):
+					if nextLabels[col] < 0:
+						nextLabels[col] = nextLabel
+						nextLabel += 1
+				labels = nextLabels
+
+			yield (eastOpen, northOpen)
+			row += 1
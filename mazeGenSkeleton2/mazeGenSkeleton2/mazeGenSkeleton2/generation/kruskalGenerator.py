@@ -0,0 +1,110 @@
+# -------------------------------------------------------------------
+# Randomised Kruskal's maze generator.
+#
+# __copyright__ = 'Copyright 2024, RMIT University'
+# -------------------------------------------------------------------
+
+from array import array
+
+from maze.maze3D import Maze3D
+from maze.util import Coordinates3D
+from generation.mazeGenerator import MazeGenerator
+from generation.disjointSet import DisjointSet
+
+
+
+
+class KruskalMazeGenerator(MazeGenerator):
+	"""
+	Randomised Kruskal's maze generator.  All walls between cells, including those between levels, are shuffled
+	once, then each wall is knocked down if the cells on either side are not yet connected.  Connectivity is tracked
+	with a disjoint set over cell numbers, where cells are numbered level by level in row-major order.
+	"""
+
+	# Wall directions, from a cell to its east, north and upper neighbour.  Each wall between cells is listed once,
+	# from its west/south/lower cell, as (cell number) * WALL_DIRECTIONS + direction.
+	EAST = 0
+	NORTH = 1
+	UP = 2
+	WALL_DIRECTIONS = 3
+
+
+
+	def steps(self, maze: Maze3D):
+		levelDims = maze.m_levelDims
+		levelOffsets : list[int] = [0]
+		for (rowNum, colNum) in levelDims:
+			levelOffsets.append(levelOffsets[-1] + rowNum * colNum)
+		totalCells : int = levelOffsets[-1]
+
+		# shuffle all walls between cells once
+		walls : array = self.cellWalls(levelDims, levelOffsets)
+		self.rng().shuffle(walls)
+
+		# every cell is in an event, so create the coordinates of all cells once
+		cellCoords : list[Coordinates3D] = [Coordinates3D(level, row, col) for (level, (rowNum, colNum)) in enumerate(levelDims)
+											for row in range(rowNum) for col in range(colNum)]
+
+		# knock down walls between cells that are not connected yet, until all cells are
+		cells : DisjointSet = DisjointSet(totalCells)
+		for wall in walls:
+			if cells.setNum() == 1:
+				break
+			(cell, direction) = divmod(wall, self.WALL_DIRECTIONS)
+			neigh : int = self.wallNeighbour(cell, direction, levelDims, levelOffsets)
+			if cells.union(cell, neigh):
+				yield (self.WALL_REMOVED, cellCoords[cell], cellCoords[neigh])
+
+
+
+	def cellWalls(self, levelDims: list[tuple[int, int]], levelOffsets: list[int])->array:
+		"""
+		Lists the walls between cells.
+
+		@param levelDims: (rowNum, colNum) of each level.
+		@param levelOffsets: Number of the first cell of each level, followed by the total number of cells.
+
+		@returns Array of walls, each encoded as (cell number) * WALL_DIRECTIONS + direction.
+		"""
+		walls : array = array('q')
+		levelNum : int = len(levelDims)
+		for (level, (rowNum, colNum)) in enumerate(levelDims):
+			(upperRowNum, upperColNum) = levelDims[level+1] if level + 1 < levelNum else (0, 0)
+			for row in range(rowNum):
+				cell : int = levelOffsets[level] + row * colNum
+				for col in range(colNum):
+					wallBase : int = cell * self.WALL_DIRECTIONS
+					if col + 1 < colNum:
+						walls.append(wallBase + self.EAST)
+					if row + 1 < rowNum:
+						walls.append(wallBase + self.NORTH)
+					if row < upperRowNum and col < upperColNum:
+						walls.append(wallBase + self.UP)
+					cell += 1
+
+		return walls
+
+
+
+	def wallNeighbour(self, cell: int, direction: int, levelDims: list[tuple[int, int]], levelOffsets: list[int])->int:
+		"""
+		@param cell: Number of the west/south/lower cell of a wall.
+		@param direction: Direction of the wall from cell.
+		@param levelDims: (rowNum, colNum) of each level.
+		@param levelOffsets: Number of the first cell of each level, followed by the total number of cells.
+
+		@returns Number of the cell on the other side of the wall.
+		"""
+		if direction == self.EAST:
+			return cell + 1
+
+		# find the level of the cell, levels are few so a linear scan is fine
+		level : int = 0
+		while levelOffsets[level+1] <= cell:
+			level += 1
+		colNum : int = levelDims[level][1]
+		if direction == self.NORTH:
+			return cell + colNum
+
+		(row, col) = divmod(cell - levelOffsets[level], colNum)
+		return levelOffsets[level+1] + row * levelDims[level+1][1] + col
@@ -7,19 +7,46 @@
 # -------------------------------------------------------------------
 
 
+from typing import Iterator, List, Tuple
+
 from maze.maze3D import Maze3D
 from maze.util import Coordinates3D
+from maze.mazeRandom import MazeRandom
 
 class MazeGenerator:
 	"""
 	Base class for a maze generator.
+
+	Generators produce the maze as a stream of events from steps(), which generateSteps() applies to the maze and
+	generateMaze() simply drains.  Events are tuples, starting with their kind:
+		(CELL_VISITED, cell, None): cell became part of the maze.
+		(WALL_REMOVED, cell1, cell2): wall between cell1 and cell2 was knocked down.
+		(WALL_ADDED, cell1, cell2): wall between cell1 and cell2 was put up.
+		(PASSAGES_CARVED, level, passages): walls of a whole level were knocked down at once, passages is a passage
+			map as for Maze3D.removeLevelPassages().
 	"""
 
+	# Kinds of generation events.
+	CELL_VISITED = 'visit'
+	WALL_REMOVED = 'remove'
+	WALL_ADDED = 'add'
+	PASSAGES_CARVED = 'passages'
+
+	# Whether generation starts from a maze with walls between all cells (see Maze3D.initCells()).
+	INIT_WALLS = True
+	# Whether those walls leave out the walls between cells of the same level (see Maze3D.initCells()).
+	INIT_OPEN_LEVELS = False
+
+	# Number of added or removed walls generateSteps() collects before applying them to the maze in bulk.
+	WALL_CHUNK = 1 << 16
+
 	
 	def __init__(self):
 		# This is used to indicate to program whether a maze been generated, or nothing has been done.
 		# Need to set this to true once a maze is generated!
 		self.m_mazeGenerated: bool = False
+		# Random stream of this generator, see rng().
+		self.m_rng: MazeRandom = None
 
 
 
@@ -29,10 +56,161 @@ class MazeGenerator:
 
 		@param maze: Maze which we update on to generate a maze. 
 		"""
+		for _ in self.generateSteps(maze):
+			pass
+
+
+
+	def generateSteps(self, maze:Maze3D, apply:bool = True)->Iterator[Tuple]:
+		"""
+		Generates a maze lazily, one event at a time (see the class description), so the generation can be streamed
+		to disk, animated, or stopped early, e.g., at a time or cell budget.
+
+		@param maze: Maze to generate.
+		@param apply: Whether to apply the events to the maze.  If True, the maze is initialised and the walls are
+			changed in bulk, WALL_CHUNK walls at a time as the events come and the rest once the iteration ends,
+			including when it is stopped early, which leaves a partially generated maze.  If False, the maze is only read for its level dimensions, and nothing is kept of the
+			events once they are consumed, so memory stays flat.  Default is True.
+
+		@returns Iterator of generation events.  The maze is only marked as generated once all events have been
+			applied, and not at all if steps() produces none.
+
+		@raises ImportError: If the generator can't be used on this computer, see checkAvailable().  Raised before
+			the maze is touched.
+		"""
+		self.checkAvailable()
+		events: Iterator[Tuple] = self.steps(maze)
+		if events is None:
+			return
+
+		if not apply:
+			yield from events
+			return
+
+		maze.initCells(self.INIT_WALLS, self.INIT_OPEN_LEVELS)
+
+		removed: List[Tuple[Coordinates3D, Coordinates3D]] = list()
+		added: List[Tuple[Coordinates3D, Coordinates3D]] = list()
+		completed: bool = False
+		eventNum: int = 0
+		try:
+			for event in events:
+				eventNum += 1
+				kind = event[0]
+				if kind == self.WALL_REMOVED:
+					removed.append((event[1], event[2]))
+					if len(removed) >= self.WALL_CHUNK:
+						maze.removeWalls(removed, trusted=True)
+						removed = list()
+				elif kind == self.WALL_ADDED:
+					added.append((event[1], event[2]))
+					if len(added) >= self.WALL_CHUNK:
+						maze.addWalls(added, trusted=True)
+						added = list()
+				elif kind == self.PASSAGES_CARVED:
+					self.applyPassages(maze, event[1], event[2])
+				yield event
+			completed = True
+		finally:
+			# generators never both add and remove the same wall, so the order doesn't matter.
+			# Events are always between a cell and one of its neighbours, so no need to check them again.
+			maze.addWalls(added, trusted=True)
+			maze.removeWalls(removed, trusted=True)
+
+		# a maze of a single cell has nothing to generate, otherwise no events means nothing was generated
+		cellNum: int = sum([rowNum * colNum for (rowNum, colNum) in maze.m_levelDims])
+		self.m_mazeGenerated = completed and (eventNum > 0 or cellNum <= 1)
+
+
+
+	def steps(self, maze:Maze3D)->Iterator[Tuple]:
+		"""
+		Abstract method for generating the events of a maze, see the class description, implemented by each
+		generator.  Only reads the level dimensions of the maze, it is up to generateSteps() to apply the events.
+
+		@param maze: Maze to generate.
+
+		@returns Iterator of generation events.
+		"""
 		pass
 
 
 
+	def checkAvailable(self):
+		"""
+		Checks that the generator can be used on this computer, e.g., that the libraries it needs are installed.
+		Called before the maze is initialised.  By default generators need nothing extra.
+
+		@raises ImportError: If the generator can't be used.
+		"""
+		pass
+
+
+
+	def applyPassages(self, maze:Maze3D, level:int, passages:bytes):
+		"""
+		Applies a PASSAGES_CARVED event to the maze.
+
+		@param maze: Maze being generated.
+		@param level: Level of the passages.
+		@param passages: Passage map of the level, see Maze3D.removeLevelPassages().
+		"""
+		maze.removeLevelPassages(level, passages)
+
+
+
+	def neighbourCells(self, levelDims:List[Tuple[int, int]], cell:Coordinates3D)->List[Coordinates3D]:
+		"""
+		@param levelDims: (rowNum, colNum) of each level of the maze.
+		@param cell: Cell of the maze.
+
+		@returns The neighbours of cell that are cells of the maze, rather than on its boundary, computed from the
+			level dimensions and in the same order as Maze3D.neighbours() lists them.
+		"""
+		level: int = cell.getLevel()
+		row: int = cell.getRow()
+		col: int = cell.getCol()
+		(rowNum, colNum) = levelDims[level]
+
+		neighbours: List[Coordinates3D] = list()
+		if col > 0:
+			neighbours.append(Coordinates3D(level, row, col-1))
+		if col + 1 < colNum:
+			neighbours.append(Coordinates3D(level, row, col+1))
+		if row > 0:
+			neighbours.append(Coordinates3D(level, row-1, col))
+		if row + 1 < rowNum:
+			neighbours.append(Coordinates3D(level, row+1, col))
+		for adjLevel in (level-1, level+1):
+			if 0 <= adjLevel < len(levelDims) and row < levelDims[adjLevel][0] and col < levelDims[adjLevel][1]:
+				neighbours.append(Coordinates3D(adjLevel, row, col))
+
+		return neighbours
+
+
+
+	def setRandom(self, rng: MazeRandom):
+		"""
+		Sets the random stream this generator draws from, e.g., MazeRandom(randSeed, ('generator',)).
+
+		@param rng: Random stream to use.
+		"""
+		self.m_rng = rng
+
+
+
+	def rng(self)->MazeRandom:
+		"""
+		@return: Random stream of this generator.  If none has been set, one is seeded from the global random module,
+			so generation still follows random.seed().
+		"""
+		if self.m_rng is None:
+			self.m_rng = MazeRandom()
+
+		return self.m_rng
+
+
+
 	def isMazeGenerated(self)->bool:
 		"""
 		@return: Whether a maze has been generated, or False if just an empty method call.
@@ -0,0 +1,157 @@
+# -------------------------------------------------------------------
+# Maze generator that generates levels, or tiles of levels, in parallel worker processes.
+#
+# __copyright__ = 'Copyright 2024, RMIT University'
+# -------------------------------------------------------------------
+
+from concurrent.futures import ProcessPoolExecutor
+import random
+
+from maze.maze3D import Maze3D
+from maze.util import Coordinates3D
+from generation.mazeGenerator import MazeGenerator
+from generation.disjointSet import DisjointSet
+
+
+
+def generatePassages(rowNum: int, colNum: int, seed: int)->bytes:
+	"""
+	Generates a perfect maze of a rectangle of cells, i.e., a level or a tile of one, with randomised Kruskal's.
+	Runs in a worker process, so it is a module level function and only takes and returns plain values.
+
+	@param rowNum: Number of rows of the rectangle.
+	@param colNum: Number of columns of the rectangle.
+	@param seed: Seed of the rectangle's random stream.
+
+	@returns Passage map of the rectangle, see Maze3D.removeLevelPassages().
+	"""
+	rng : random.Random = random.Random(seed)
+
+	# walls between cells, as cell * 2 for the east wall and cell * 2 + 1 for the north wall
+	walls : list[int] = [cell * 2 for cell in range(rowNum * colNum) if cell % colNum < colNum - 1] + \
+						[cell * 2 + 1 for cell in range((rowNum - 1) * colNum)]
+	rng.shuffle(walls)
+
+	passages : bytearray = bytearray(rowNum * colNum)
+	cells : DisjointSet = DisjointSet(rowNum * colNum)
+	for wall in walls:
+		(cell, isNorth) = divmod(wall, 2)
+		if cells.union(cell, cell + colNum if isNorth else cell + 1):
+			passages[cell] |= Maze3D.PASSAGE_NORTH if isNorth else Maze3D.PASSAGE_EAST
+			if cells.setNum() == 1:
+				break
+
+	return bytes(passages)
+
+
+
+
+class ParallelLevelMazeGenerator(MazeGenerator):
+	"""
+	Generates each level as a separate perfect maze in a pool of worker processes, then joins adjacent levels with
+	one passage each, at a random cell both levels have, so the 3D maze is perfect.
+
+	With a tile size, levels are further cut into tiles of at most tileSize x tileSize cells, and each tile is
+	generated separately.  The tiles of a level are then joined by randomised Kruskal's over the walls between tiles,
+	which opens exactly one wall between the tiles of each spanning tree edge, so the level is still perfect.
+
+	Workers return compact passage maps rather than mazes.  Every tile gets its own seed, and all random choices of
+	this process are made in a fixed order, so the maze only depends on the random seed (and tile size) and not on
+	the number of workers or the order they finish in.
+	"""
+
+	def __init__(self, workerNum: int = None, tileSize: int = None):
+		"""
+		Constructor.
+
+		@param workerNum: Number of worker processes.  Default is None, one per CPU.  With 1, everything is
+			generated in this process.
+		@param tileSize: Maximum number of rows and columns of a tile.  Default is None, one tile per level.
+		"""
+		super().__init__()
+		self.m_workerNum : int = workerNum
+		self.m_tileSize : int = tileSize
+
+
+
+	def steps(self, maze: Maze3D):
+		levelDims : list[tuple[int, int]] = maze.m_levelDims
+		levelNum : int = len(levelDims)
+
+		# (level, first row, first column, rows, columns) of each tile, in a fixed order
+		tiles : list[tuple[int, int, int, int, int]] = list()
+		for (level, (rowNum, colNum)) in enumerate(levelDims):
+			(tileRowNum, tileColNum) = (rowNum, colNum) if self.m_tileSize is None else (self.m_tileSize, self.m_tileSize)
+			for row0 in range(0, rowNum, tileRowNum):
+				for col0 in range(0, colNum, tileColNum):
+					tiles.append((level, row0, col0, min(tileRowNum, rowNum - row0), min(tileColNum, colNum - col0)))
+
+		# every tile gets its own substream, so its draws don't depend on which worker generates it, or when
+		rng = self.rng()
+		seeds : list[int] = [rng.split(tileIndex).streamKey() for tileIndex in range(len(tiles))]
+		upPassages : list[tuple[int, int]] = [(rng.randint(0, min(levelDims[level][0], levelDims[level+1][0]) - 1),
+											   rng.randint(0, min(levelDims[level][1], levelDims[level+1][1]) - 1))
+											  for level in range(levelNum - 1)]
+
+		tileRowNums : list[int] = [tile[3] for tile in tiles]
+		tileColNums : list[int] = [tile[4] for tile in tiles]
+		if self.m_workerNum == 1 or len(tiles) == 1:
+			tilePassages : list[bytes] = list(map(generatePassages, tileRowNums, tileColNums, seeds))
+		else:
+			with ProcessPoolExecutor(max_workers=self.m_workerNum) as executor:
+				tilePassages = list(executor.map(generatePassages, tileRowNums, tileColNums, seeds))
+
+		tileIndex : int = 0
+		for (level, (rowNum, colNum)) in enumerate(levelDims):
+			if self.m_tileSize is None:
+				passages : bytes = tilePassages[tileIndex]
+				tileIndex += 1
+			else:
+				# copy the tiles of this level into one passage map, a tile row at a time
+				passages = bytearray(rowNum * colNum)
+				while tileIndex < len(tiles) and tiles[tileIndex][0] == level:
+					(_, row0, col0, tileRowNum, tileColNum) = tiles[tileIndex]
+					tile : bytes = tilePassages[tileIndex]
+					for row in range(tileRowNum):
+						start : int = (row0 + row) * colNum + col0
+						passages[start:start + tileColNum] = tile[row * tileColNum:(row + 1) * tileColNum]
+					tileIndex += 1
+				self.joinTiles(rowNum, colNum, passages)
+
+			yield (self.PASSAGES_CARVED, level, bytes(passages))
+
+		for (level, (row, col)) in enumerate(upPassages):
+			yield (self.WALL_REMOVED, Coordinates3D(level, row, col), Coordinates3D(level+1, row, col))
+
+
+
+	def joinTiles(self, rowNum: int, colNum: int, passages: bytearray):
+		"""
+		Joins the separately generated tiles of a level into a single perfect maze, by randomised Kruskal's over the
+		walls between tiles, with a disjoint set over tiles.
+
+		@param rowNum: Number of rows of the level.
+		@param colNum: Number of columns of the level.
+		@param passages: Passage map of the level, with the passages within each tile.  Updated with the passages
+			between tiles.
+		"""
+		tileSize : int = self.m_tileSize
+		tileColNum : int = (colNum + tileSize - 1) // tileSize
+		tileNum : int = ((rowNum + tileSize - 1) // tileSize) * tileColNum
+
+		# walls between tiles, as cell * 2 for the east wall and cell * 2 + 1 for the north wall
+		walls : list[int] = [(row * colNum + col) * 2 for col in range(tileSize - 1, colNum - 1, tileSize)
+							 for row in range(rowNum)] + \
+							[(row * colNum + col) * 2 + 1 for row in range(tileSize - 1, rowNum - 1, tileSize)
+							 for col in range(colNum)]
+		self.rng().shuffle(walls)
+
+		tileSets : DisjointSet = DisjointSet(tileNum)
+		for wall in walls:
+			if tileSets.setNum() == 1:
+				break
+			(cell, isNorth) = divmod(wall, 2)
+			(row, col) = divmod(cell, colNum)
+			tile : int = (row // tileSize) * tileColNum + col // tileSize
+			if tileSets.union(tile, tile + tileColNum if isNorth else tile + 1):
+				passages[cell] |= Maze3D.PASSAGE_NORTH if isNorth else Maze3D.PASSAGE_EAST
@@ -1,103 +1,183 @@
-import random
+import heapq
 from maze.maze3D import Maze3D
 from maze.util import Coordinates3D
+from maze.gridLayout import GridLayout
 from generation.mazeGenerator import MazeGenerator
 
 class PrimMazeGenerator(MazeGenerator):
     """
     Prim's algorithm maze generator.
-    TODO: Complete the implementation (Task A)
+
+    By default, the frontier holds the cells next to the maze, each exactly once, with its state in a per cell
+    array.  Each step picks a frontier cell uniformly at random and joins it to a random neighbour that is already
+    part of the maze.  The picked cell is swapped with the last one before removing it, so every step takes
+    constant time, and the frontier never holds more than one entry per cell.
+    In weighted mode, every wall gets a random weight when it joins the frontier and the lightest wall is picked,
+    i.e., true Prim's on a randomly weighted grid, using a heap so every step takes logarithmic time.
     """
-    
-    def generateMaze(self, maze: Maze3D):
+
+    # States of a cell, kept in a bytearray indexed as the maze's GridLayout.
+    NOT_REACHED = 0
+    IN_FRONTIER = 1
+    IN_MAZE = 2
+
+    def __init__(self, weighted: bool = False):
+        """
+        Constructor.
+
+        Parameters:
+        weighted (bool): Whether to pick the lightest wall of randomly weighted walls, rather than a random cell.
+        """
+        super().__init__()
+        self.m_weighted = weighted
+
+    def steps(self, maze: Maze3D):
         """
-        Generate a 3D maze using Prim's algorithm.
-        
+        Generate the events of a 3D maze using Prim's algorithm.
+
         Parameters:
         maze (Maze3D): The maze object to be generated.
         """
         # Get the dimensions of the maze levels
         mazeDimensions = maze.m_levelDims
         numberOfLevels = len(mazeDimensions)
-        
-        # Initialize the maze with walls between all cells
-        maze.initCells(addWallFlag=True)
-        print("Initialized cells with walls.")
-        
+
         # Choose a random starting cell within the maze
-        startLevel = random.randint(0, numberOfLevels - 1)
-        startRow = random.randint(0, mazeDimensions[startLevel][0] - 1)
-        startColumn = random.randint(0, mazeDimensions[startLevel][1] - 1)
+        rng = self.rng()
+        startLevel = rng.randint(0, numberOfLevels - 1)
+        startRow = rng.randint(0, mazeDimensions[startLevel][0] - 1)
+        startColumn = rng.randint(0, mazeDimensions[startLevel][1] - 1)
         startingCell = Coordinates3D(startLevel, startRow, startColumn)
-        print(f"Starting cell: {startingCell}")
-        
-        # Initialize the frontier with the walls of the starting cell
+
+        layout = GridLayout(mazeDimensions)
+        cellStates = bytearray(layout.size())
+        startIndex = layout.coordIndex(startingCell)
+
+        if self.m_weighted:
+            yield from self.weightedSteps(maze, startingCell, startIndex, layout, cellStates)
+            return
+
+        # The frontier holds the (cell, index) of the cells next to the maze
+        cellFrontier = []
+        self.addCellsToFrontier(startIndex, self.getNeighboringIndices(maze, layout, startingCell, startIndex),
+                                cellFrontier, cellStates)
+        yield (self.CELL_VISITED, startingCell, None)
+
+        # Loop until there are no more cells in the frontier
+        while cellFrontier:
+            # Take a random cell, by swapping it with the last cell and removing that
+            index = rng.randrange(len(cellFrontier))
+            cellFrontier[index], cellFrontier[-1] = cellFrontier[-1], cellFrontier[index]
+            cell, cellIndex = cellFrontier.pop()
+
+            # Join it to a random neighbour in the maze, there is at least the one that added it to the frontier
+            neighbors = self.getNeighboringIndices(maze, layout, cell, cellIndex)
+            inMaze = [neighbor for (neighbor, neighborIndex) in neighbors if cellStates[neighborIndex] == self.IN_MAZE]
+            yield (self.WALL_REMOVED, rng.choice(inMaze), cell)
+
+            # Add the unreached neighbours of the new cell to the frontier
+            self.addCellsToFrontier(cellIndex, neighbors, cellFrontier, cellStates)
+            yield (self.CELL_VISITED, cell, None)
+
+    def weightedSteps(self, maze, startingCell, startIndex, layout, cellStates):
+        """
+        Generate the events of weighted mode.
+
+        A cell can be behind several walls of the heap at once, as each wall has its own weight and the lightest one
+        has to win.  The heap has no way to lower or drop an entry, so the other walls stay in it and are skipped when
+        popped (lazy deletion).  There are at most six walls per cell, so the heap still stays O(cells).
+
+        Parameters:
+        maze (Maze3D): The maze object to be generated.
+        startingCell (Coordinates3D): The cell to start from.
+        startIndex (int): Layout index of the starting cell.
+        layout (GridLayout): Layout of the maze's vertices, to index cellStates with.
+        cellStates (bytearray): State of every cell, all NOT_REACHED.
+        """
+        # The frontier holds (weight, cell, cell index, neighbor, neighbor index) walls
         wallFrontier = []
-        visitedCells = set()
-        self.addWallsToFrontier(maze, startingCell, wallFrontier, visitedCells)
-        print("Initialized frontier and visited set.")
-        
+        self.addWallsToFrontier(maze, layout, startingCell, startIndex, wallFrontier, cellStates)
+        yield (self.CELL_VISITED, startingCell, None)
+
         # Loop until there are no more walls in the frontier
         while wallFrontier:
-            # Choose a random wall from the frontier
-            currentWall = random.choice(wallFrontier)
-            wallFrontier.remove(currentWall)
-            cell1, cell2 = currentWall
-            
-            # If the second cell has already been visited, skip this wall
-            if cell2 in visitedCells:
+            # Take the lightest wall
+            _, cell1, _, cell2, index2 = heapq.heappop(wallFrontier)
+
+            # If the second cell has been visited since the wall joined the frontier, the wall is stale
+            if cellStates[index2] == self.IN_MAZE:
                 continue
-            
+
             # Remove the wall between cell1 and cell2
-            maze.removeWall(cell1, cell2)
-            visitedCells.add(cell2)
-            
+            yield (self.WALL_REMOVED, cell1, cell2)
+
             # Add the walls of the new cell to the frontier
-            self.addWallsToFrontier(maze, cell2, wallFrontier, visitedCells)
-        
-        self.m_mazeGenerated = True
-        print("Maze generation complete.")
-    
-    def addWallsToFrontier(self, maze, cell, wallFrontier, visitedCells):
+            self.addWallsToFrontier(maze, layout, cell2, index2, wallFrontier, cellStates)
+            yield (self.CELL_VISITED, cell2, None)
+
+    def addCellsToFrontier(self, cellIndex, neighbors, cellFrontier, cellStates):
         """
-        Add the walls of a cell to the frontier.
-        
+        Mark a cell as part of the maze, and add its neighbours that are not reached yet to the frontier.
+
+        Parameters:
+        cellIndex (int): Layout index of the current cell.
+        neighbors (list): (cell, index) of the neighbours of the current cell, see getNeighboringIndices().
+        cellFrontier (list): The list of (cell, index) in the frontier.
+        cellStates (bytearray): State of every cell.
+        """
+        cellStates[cellIndex] = self.IN_MAZE
+        for (neighbor, neighborIndex) in neighbors:
+            if cellStates[neighborIndex] == self.NOT_REACHED:
+                cellStates[neighborIndex] = self.IN_FRONTIER
+                cellFrontier.append((neighbor, neighborIndex))
+
+    def addWallsToFrontier(self, maze, layout, cell, cellIndex, wallFrontier, cellStates):
+        """
+        Mark a cell as part of the maze, and add its walls to cells not in the maze yet to the frontier.
+
         Parameters:
         maze (Maze3D): The maze object.
+        layout (GridLayout): Layout of the maze's vertices.
         cell (Coordinates3D): The current cell.
-        wallFrontier (list): The list of walls in the frontier.
-        visitedCells (set): The set of visited cells.
+        cellIndex (int): Layout index of the current cell.
+        wallFrontier (list): The heap of walls in the frontier.
+        cellStates (bytearray): State of every cell.
         """
-        visitedCells.add(cell)
-        for neighbor in self.getNeighboringCells(maze, cell):
-            if neighbor not in visitedCells:
-                wallFrontier.append((cell, neighbor))
+        cellStates[cellIndex] = self.IN_MAZE
+        for (neighbor, neighborIndex) in self.getNeighboringIndices(maze, layout, cell, cellIndex):
+            if cellStates[neighborIndex] != self.IN_MAZE:
+                heapq.heappush(wallFrontier, (self.rng().random(), cell, cellIndex, neighbor, neighborIndex))
 
-    def getNeighboringCells(self, maze, cell):
+    def getNeighboringIndices(self, maze, layout, cell, cellIndex):
         """
-        Get the neighboring cells of a given cell.
-        
+        Get the neighboring cells of a given cell, with their layout indices.
+
         Parameters:
         maze (Maze3D): The maze object.
+        layout (GridLayout): Layout of the maze's vertices.
         cell (Coordinates3D): The current cell.
-        
+        cellIndex (int): Layout index of the current cell.
+
         Returns:
-        list: A list of neighboring cells.
+        list: (cell, index) of the neighboring cells within the maze, as MazeGenerator.neighbourCells() lists them.
         """
-        # Define possible directions for neighboring cells
-        directions = [
-            Coordinates3D(0, 1, 0),  # up
-            Coordinates3D(0, -1, 0),  # down
-            Coordinates3D(0, 0, 1),  # right
-            Coordinates3D(0, 0, -1),  # left
-            Coordinates3D(1, 0, 0),  # above
-            Coordinates3D(-1, 0, 0)  # below
-        ]
-        
+        level, row, col = cell.getLevel(), cell.getRow(), cell.getCol()
+        rowNum, colNum = maze.m_levelDims[level]
+        width = layout.width(level)
+
+        # Neighbours on the same level are next to each other in the layout, or a layout row apart
         neighbors = []
-        for direction in directions:
-            neighbor = cell + direction
-            # Check if the neighbor is within the maze boundaries and not a boundary itself
-            if (0 <= neighbor.getLevel() < len(maze.m_levelDims)) and maze.checkCoordinates(neighbor) and not maze.isBoundary(neighbor):
-                neighbors.append(neighbor)
+        if col > 0:
+            neighbors.append((Coordinates3D(level, row, col - 1), cellIndex - 1))
+        if col + 1 < colNum:
+            neighbors.append((Coordinates3D(level, row, col + 1), cellIndex + 1))
+        if row > 0:
+            neighbors.append((Coordinates3D(level, row - 1, col), cellIndex - width))
+        if row + 1 < rowNum:
+            neighbors.append((Coordinates3D(level, row + 1, col), cellIndex + width))
+        for adjLevel in (level - 1, level + 1):
+            if 0 <= adjLevel < len(maze.m_levelDims) and row < maze.m_levelDims[adjLevel][0] \
+                    and col < maze.m_levelDims[adjLevel][1]:
+                neighbors.append((Coordinates3D(adjLevel, row, col), layout.index(adjLevel, row, col)))
+
         return neighbors
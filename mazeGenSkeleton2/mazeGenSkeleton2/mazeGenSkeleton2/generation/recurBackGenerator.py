@@ -6,7 +6,6 @@
 # __copyright__ = 'Copyright 2024, RMIT University'
 # -------------------------------------------------------------------
 
-from random import randint, choice
 from collections import deque
 
 from maze.maze3D import Maze3D
@@ -22,14 +21,14 @@ class RecurBackMazeGenerator(MazeGenerator):
 	how to implement the other generators of Task A.
 	"""
 
-	def generateMaze(self, maze: Maze3D):
-		# make sure we start the maze with all walls there
-		maze.initCells(True)
+	def steps(self, maze: Maze3D):
+		rng = self.rng()
 
 		# select starting cell 
 		# random floor
-		startLevel = randint(0, maze.levelNum()-1)
-		startCoord : Coordinates3D = Coordinates3D(startLevel, randint(0, maze.rowNum(startLevel)-1), randint(0, maze.colNum(startLevel)-1))
+		startLevel = rng.randint(0, maze.levelNum()-1)
+		startCoord : Coordinates3D = Coordinates3D(startLevel, rng.randint(0, maze.rowNum(startLevel)-1), rng.randint(0, maze.colNum(startLevel)-1))
+		yield (self.CELL_VISITED, startCoord, None)
 
 		# run recursive backtracking/DFS from starting cell
 		stack : deque = deque()
@@ -40,21 +39,18 @@ class RecurBackMazeGenerator(MazeGenerator):
 		totalCells = sum([maze.rowNum(l) * maze.colNum(l) for l in range(maze.levelNum())])
 
 		while len(visited) < totalCells:
-			# find all neighbours of current cell
-			neighbours : list[Coordinates3D] = maze.neighbours(currCell)
-
-			# filter to ones that haven't been visited and within boundary
-			nonVisitedNeighs : list[Coordinates3D] = [neigh for neigh in neighbours if neigh not in visited and\
-											 neigh.getRow() >= 0 and neigh.getRow() < maze.rowNum(neigh.getLevel()) and\
-												neigh.getCol() >= 0 and neigh.getCol() < maze.colNum(neigh.getLevel())]
+			# find all neighbours of current cell that haven't been visited, and are within boundary
+			nonVisitedNeighs : list[Coordinates3D] = [neigh for neigh in self.neighbourCells(maze.m_levelDims, currCell)
+													  if neigh not in visited]
 			
 			# see if any unvisited neighbours
 			if len(nonVisitedNeighs) > 0:
 				# randomly select one of them
-				neigh = choice(nonVisitedNeighs)
+				neigh = rng.choice(nonVisitedNeighs)
 
 				# we move there and knock down wall
-				maze.removeWall(currCell, neigh)
+				yield (self.WALL_REMOVED, currCell, neigh)
+				yield (self.CELL_VISITED, neigh, None)
 
 				# add to stack
 				stack.append(neigh)
@@ -67,8 +63,3 @@ class RecurBackMazeGenerator(MazeGenerator):
 			else:
 				# backtrack
 				currCell = stack.pop()
-
-		# update maze generated
-		self.m_mazeGenerated = True
-
-		
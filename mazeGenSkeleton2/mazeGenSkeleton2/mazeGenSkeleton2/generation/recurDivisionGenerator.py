@@ -0,0 +1,92 @@
+# -------------------------------------------------------------------
+# Recursive division maze generator.
+#
+# __copyright__ = 'Copyright 2024, RMIT University'
+# -------------------------------------------------------------------
+
+from collections import deque
+from typing import Iterator, Tuple
+
+from maze.maze3D import Maze3D
+from maze.util import Coordinates3D
+from generation.mazeGenerator import MazeGenerator
+
+
+
+
+class RecursiveDivisionMazeGenerator(MazeGenerator):
+	"""
+	Recursive division maze generator.  Unlike the other generators, this starts from levels without any walls
+	inside them and adds walls: each level's rectangle is split in two by a wall with a single gap, and both halves are
+	split in turn until they are a single row or column wide.  The splits are kept on an explicit work stack rather
+	than the call stack, so very large levels cannot overflow it.
+
+	The boundary of each level and the edges between levels are already walled by Maze3D.initCells().  Once all
+	levels are divided, one passage is opened between each pair of adjacent levels, at a random cell both levels
+	have, so the 3D maze is perfect.
+	"""
+
+	# start with walls only around and between the levels, the walls inside the levels are added
+	INIT_WALLS = True
+	INIT_OPEN_LEVELS = True
+
+
+
+	def steps(self, maze: Maze3D):
+		levelDims : list[tuple[int, int]] = maze.m_levelDims
+
+		for (level, (rowNum, colNum)) in enumerate(levelDims):
+			yield from self.divideLevel(level, rowNum, colNum)
+
+		# connections between levels, placed once all levels are divided
+		rng = self.rng()
+		for level in range(len(levelDims) - 1):
+			(sharedRowNum, sharedColNum) = (min(levelDims[level][0], levelDims[level+1][0]),
+											min(levelDims[level][1], levelDims[level+1][1]))
+			(row, col) = (rng.randint(0, sharedRowNum - 1), rng.randint(0, sharedColNum - 1))
+			yield (self.WALL_REMOVED, Coordinates3D(level, row, col), Coordinates3D(level+1, row, col))
+
+
+
+	def divideLevel(self, level: int, rowNum: int, colNum: int)->Iterator[Tuple[str, Coordinates3D, Coordinates3D]]:
+		"""
+		Divides a level into a perfect maze.
+
+		@param level: Level to divide.
+		@param rowNum: Number of rows of the level.
+		@param colNum: Number of columns of the level.
+
+		@returns Iterator of WALL_ADDED events of the dividing walls.
+		"""
+		rng = self.rng()
+
+		# rectangles still to divide, as (bottom row, left column, height, width)
+		stack : deque = deque()
+		stack.append((0, 0, rowNum, colNum))
+
+		while len(stack) > 0:
+			(row0, col0, height, width) = stack.pop()
+
+			# a single row or column is already a corridor
+			if height < 2 or width < 2:
+				continue
+
+			# split across the longer side, so the halves don't become long thin corridors
+			if width > height or (width == height and rng.random() < 0.5):
+				# wall between columns splitCol and splitCol+1, with a gap at row gapRow
+				splitCol : int = rng.randint(col0, col0 + width - 2)
+				gapRow : int = rng.randint(row0, row0 + height - 1)
+				for row in range(row0, row0 + height):
+					if row != gapRow:
+						yield (self.WALL_ADDED, Coordinates3D(level, row, splitCol), Coordinates3D(level, row, splitCol+1))
+				stack.append((row0, col0, height, splitCol - col0 + 1))
+				stack.append((row0, splitCol + 1, height, col0 + width - splitCol - 1))
+			else:
+				# wall between rows splitRow and splitRow+1, with a gap at column gapCol
+				splitRow : int = rng.randint(row0, row0 + height - 2)
+				gapCol : int = rng.randint(col0, col0 + width - 1)
+				for col in range(col0, col0 + width):
+					if col != gapCol:
+						yield (self.WALL_ADDED, Coordinates3D(level, splitRow, col), Coordinates3D(level, splitRow+1, col))
+				stack.append((row0, col0, splitRow - row0 + 1, width))
+				stack.append((splitRow + 1, col0, row0 + height - splitRow - 1, width))
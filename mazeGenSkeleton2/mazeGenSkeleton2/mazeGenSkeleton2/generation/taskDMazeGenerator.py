@@ -7,7 +7,6 @@
 # -------------------------------------------------------------------
 
 
-from random import randint, choice
 from collections import deque
 from maze.maze3D import Maze3D
 from maze.util import Coordinates3D
@@ -40,6 +39,28 @@ class TaskDMazeGenerator(MazeGenerator):
         # Mark the maze as generated
         self.m_mazeGenerated = True
 
+    def generateSteps(self, maze_structure: Maze3D, apply: bool = True):
+        """
+        Generate the maze in one go, as this generator does not produce generation events.  Falls back to
+        generateMaze(), so callers of generateSteps() still get a generated maze, but the iterator yields nothing.
+
+        Parameters:
+        - maze_structure (Maze3D): The 3D maze structure to be generated.
+        - apply (bool): Whether to generate on maze_structure itself.  Otherwise only its level dimensions are read,
+          and a private maze of the same dimensions is generated and dropped.
+
+        Returns:
+        - Iterator: Empty iterator of generation events.
+        """
+        if apply:
+            self.generateMaze(maze_structure)
+        else:
+            # nothing is applied, so the caller's maze is not generated either
+            generated = self.m_mazeGenerated
+            self.generateMaze(Maze3D(maze_structure.m_levelDims, 'implicit'))
+            self.m_mazeGenerated = generated
+        return iter(())
+
     def generate_for_wall_follower(self, maze_structure):
         """
         Generate a maze with loops and dead-ends to challenge wall-following solvers.
@@ -79,7 +100,7 @@ class TaskDMazeGenerator(MazeGenerator):
                          for lvl in range(maze_structure.levelNum())
                          for rw in range(maze_structure.rowNum(lvl))
                          for cl in range(maze_structure.colNum(lvl))]
-        initial_position = choice(all_positions)  # Choose a random starting position
+        initial_position = self.rng().choice(all_positions)  # Choose a random starting position
         visited_positions = set([initial_position])  # Keep track of visited positions
         position_stack = [initial_position]  # Stack for DFS
 
@@ -91,7 +112,7 @@ class TaskDMazeGenerator(MazeGenerator):
                          if maze_structure.hasWall(current_position, neighbor) and neighbor not in visited_positions]
             if neighbors:
                 position_stack.append(current_position)  # Put current back to stack for further exploration
-                chosen_neighbor = choice(neighbors)  # Choose a random neighbor
+                chosen_neighbor = self.rng().choice(neighbors)  # Choose a random neighbor
                 maze_structure.removeWall(current_position, chosen_neighbor)  # Remove the wall between current and chosen neighbor
                 visited_positions.add(chosen_neighbor)  # Mark the chosen neighbor as visited
                 position_stack.append(chosen_neighbor)  # Add the chosen neighbor to the stack
@@ -115,7 +136,7 @@ class TaskDMazeGenerator(MazeGenerator):
             neighbors = [neighbor for neighbor in maze_structure.neighbours(current_position) 
                          if not maze_structure.hasWall(current_position, neighbor) and neighbor not in visited_positions]
             if neighbors:
-                chosen_neighbor = choice(neighbors)  # Choose a random neighbor
+                chosen_neighbor = self.rng().choice(neighbors)  # Choose a random neighbor
                 maze_structure.removeWall(current_position, chosen_neighbor)  # Remove the wall between current and chosen neighbor
                 visited_positions.add(chosen_neighbor)  # Mark the chosen neighbor as visited
                 position_stack.append(chosen_neighbor)  # Add the chosen neighbor to the stack
@@ -129,9 +150,9 @@ class TaskDMazeGenerator(MazeGenerator):
         """
         maze_structure.initCells(True)  # Initialize the maze cells with walls
         # Choose a random starting position
-        initial_position = Coordinates3D(randint(0, maze_structure.levelNum() - 1), 
-                                         randint(0, maze_structure.rowNum(0) - 1), 
-                                         randint(0, maze_structure.colNum(0) - 1))
+        initial_position = Coordinates3D(self.rng().randint(0, maze_structure.levelNum() - 1), 
+                                         self.rng().randint(0, maze_structure.rowNum(0) - 1), 
+                                         self.rng().randint(0, maze_structure.colNum(0) - 1))
         visited_positions = set([initial_position])  # Keep track of visited positions
         frontier_positions = [initial_position]  # List for BFS
 
@@ -0,0 +1,109 @@
+# -------------------------------------------------------------------
+# Binary tree and sidewinder maze generators, vectorised with NumPy.
+#
+# __copyright__ = 'Copyright 2024, RMIT University'
+# -------------------------------------------------------------------
+
+# NumPy is optional, only these generators need it.
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+from maze.maze3D import Maze3D
+from maze.util import Coordinates3D
+from generation.mazeGenerator import MazeGenerator
+
+
+
+
+class VectorisedMazeGenerator(MazeGenerator):
+	"""
+	Base class for generators that decide the passages of a whole level at once, with NumPy random arrays and
+	boolean masks, rather than one cell at a time.  Each level is carved into a perfect maze by carveLevel(), then
+	adjacent levels are joined by one passage each, at a random cell both levels have, so the 3D maze is perfect.
+	"""
+
+	def checkAvailable(self):
+		# fail before the maze is touched, as MazeRandom.numpyGenerator() does
+		if np is None:
+			raise ImportError("NumPy not available on this computer.  {} cannot be used.".format(type(self).__name__))
+
+
+
+	def steps(self, maze: Maze3D):
+		# counter-based NumPy generator keyed by this generator's random stream
+		rng = self.rng().numpyGenerator()
+
+		for (level, (rowNum, colNum)) in enumerate(maze.m_levelDims):
+			(eastOpen, northOpen) = self.carveLevel(rng, rowNum, colNum)
+			passages = eastOpen * np.uint8(Maze3D.PASSAGE_EAST) | northOpen * np.uint8(Maze3D.PASSAGE_NORTH)
+			yield (self.PASSAGES_CARVED, level, passages.astype(np.uint8).tobytes())
+
+		# one passage between each pair of adjacent levels, chosen for all pairs at once
+		if maze.levelNum() > 1:
+			levelDims = np.array(maze.m_levelDims)
+			sharedDims = np.minimum(levelDims[:-1], levelDims[1:])
+			ups = zip(rng.integers(0, sharedDims[:, 0]).tolist(), rng.integers(0, sharedDims[:, 1]).tolist())
+			for (level, (row, col)) in enumerate(ups):
+				yield (self.WALL_REMOVED, Coordinates3D(level, row, col), Coordinates3D(level+1, row, col))
+
+
+
+	def carveLevel(self, rng, rowNum: int, colNum: int):
+		"""
+		Abstract method to carve a single level into a perfect maze, implemented by each subclass.
+
+		@param rng: NumPy random generator to draw from.
+		@param rowNum: Number of rows of the level.
+		@param colNum: Number of columns of the level.
+
+		@returns (eastOpen, northOpen), boolean arrays of shape (rowNum, colNum), where eastOpen[row, col] and
+			northOpen[row, col] are True if there is a passage from (row, col) to its east or north neighbour
+			respectively.
+		"""
+		pass
+
+
+
+
+class BinaryTreeMazeGenerator(VectorisedMazeGenerator):
+	"""
+	Binary tree maze generator.  Every cell has a passage either north or east, chosen at random, except along the
+	top row, which can only go east, and the east column, which can only go north.
+	"""
+
+	def carveLevel(self, rng, rowNum: int, colNum: int):
+		northOpen = rng.random((rowNum, colNum)) < 0.5
+		northOpen[:, -1] = True
+		northOpen[-1, :] = False
+
+		eastOpen = ~northOpen
+		eastOpen[:, -1] = False
+
+		return (eastOpen, northOpen)
+
+
+
+
+class SidewinderMazeGenerator(VectorisedMazeGenerator):
+	"""
+	Sidewinder maze generator.  Each row is split into runs of cells joined east to east at random, and each run
+	gets a passage north from one of its cells, chosen at random.  The top row is a single run with no passage north.
+	"""
+
+	def carveLevel(self, rng, rowNum: int, colNum: int):
+		eastOpen = rng.random((rowNum, colNum)) < 0.5
+		eastOpen[:, -1] = False
+		eastOpen[-1, :-1] = True
+
+		# runs end wherever there is no passage east, which includes the end of every row, so runs never span rows
+		runEnds = np.flatnonzero(~eastOpen[:-1])
+		runStarts = np.concatenate(([0], runEnds + 1))[:-1]
+		# pick a cell of each run uniformly, as an index into the flattened rows
+		northCells = runStarts + (rng.random(len(runEnds)) * (runEnds - runStarts + 1)).astype(np.int64)
+
+		northOpen = np.zeros((rowNum, colNum), dtype=bool)
+		northOpen.ravel()[northCells] = True
+
+		return (eastOpen, northOpen)
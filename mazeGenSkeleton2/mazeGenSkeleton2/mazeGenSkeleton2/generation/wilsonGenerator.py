@@ -1,83 +1,129 @@
 from maze.maze3D import Maze3D
 from maze.util import Coordinates3D
 from generation.mazeGenerator import MazeGenerator
-from collections import defaultdict
-from typing import List, Tuple
-import random
+from array import array
+from typing import List
 
 class WilsonMazeGenerator(MazeGenerator):
     """
     Wilson's algorithm maze generator.
+
+    Cells are numbered level by level in row-major order, and all per-cell state is kept in flat arrays indexed by
+    cell number: the neighbours of each cell, whether it is in the tree, and the direction the random walk last
+    left it by.  Overwriting that direction on every visit erases loops implicitly, as retracing the walk from its
+    start only follows the last exit taken from each cell.  Unvisited cells are kept in a pool, where removing a
+    cell swaps it with the last one, so picking the start of each walk takes constant time.
     """
 
-    def generateMaze(self, maze: Maze3D):
+    def steps(self, maze: Maze3D):
         """
-        Generate a 3D maze using Wilson's algorithm.
-        
+        Generate the events of a 3D maze using Wilson's algorithm.
+
         Parameters:
         maze (Maze3D): The maze object to be generated.
         """
-        # Initialize the maze with walls between all cells
-        maze.initCells(addWallFlag=True)
-
-        # Dictionary to store cells and their neighbors
-        cellNeighbors = defaultdict(list)
-        totalCells = 0
-
-        # Populate the cellNeighbors dictionary
-        for level in range(maze.levelNum()):
-            for row in range(maze.rowNum(level)):
-                for col in range(maze.colNum(level)):
-                    currentCell = Coordinates3D(level, row, col)
-                    neighbors = [neighbor for neighbor in maze.neighbours(currentCell) if self.coordinateExists(neighbor, maze)]
-                    if neighbors:
-                        cellNeighbors[currentCell].extend(neighbors)
-                    totalCells += 1
+        levelDims = maze.m_levelDims
+        levelOffsets = self.cellOffsets(levelDims)
+        totalCells = levelOffsets[-1]
+
+        # Neighbours of cell i are neighborIds[neighborStart[i]:neighborStart[i+1]]
+        neighborStart, neighborIds = self.buildNeighbors(levelDims, levelOffsets)
+
+        # Direction (index into the cell's neighbours) the walk last left each cell by
+        nextDirection = bytearray(totalCells)
+        inTree = bytearray(totalCells)
+
+        # Pool of cells not in the tree, and the position of each cell in it
+        unvisitedPool = array('i', range(totalCells))
+        poolPosition = array('i', range(totalCells))
+
+        def addToTree(cell):
+            inTree[cell] = 1
+            position = poolPosition[cell]
+            lastCell = unvisitedPool[-1]
+            unvisitedPool[position] = lastCell
+            poolPosition[lastCell] = position
+            unvisitedPool.pop()
+
+        # Every cell is in an event, so create the coordinates of all cells once
+        cellCoords = [Coordinates3D(level, row, col) for level, (rowNum, colNum) in enumerate(levelDims)
+                      for row in range(rowNum) for col in range(colNum)]
 
         # Randomly select the initial cell and add it to the maze
-        initialCell = random.choice(list(cellNeighbors.keys()))
-        maze.removeWall(initialCell, initialCell)
-        visitedCells = {initialCell}
-        
+        rng = self.rng()
+        initialCell = rng.randrange(totalCells)
+        addToTree(initialCell)
+        yield (self.CELL_VISITED, cellCoords[initialCell], None)
+
         # Loop until all cells are added to the maze
-        while len(visitedCells) < totalCells:
-            unvisitedCells = list(cellNeighbors.keys())
-            # Choose a random unvisited cell and start a random walk until a visited cell is reached
-            currentCell = random.choice(unvisitedCells)
-
-            path = [currentCell]
-            while currentCell not in visitedCells:
-                nextCell = random.choice(cellNeighbors[currentCell])
-                if nextCell in path:
-                    loopIndex = path.index(nextCell)
-                    path = path[:loopIndex + 1]
-                else:
-                    path.append(nextCell)
+        while unvisitedPool:
+            # Choose a random unvisited cell and walk randomly until a cell in the tree is reached
+            startCell = unvisitedPool[rng.randrange(len(unvisitedPool))]
+            currentCell = startCell
+            while not inTree[currentCell]:
+                start = neighborStart[currentCell]
+                direction = rng.randrange(neighborStart[currentCell + 1] - start)
+                nextDirection[currentCell] = direction
+                currentCell = neighborIds[start + direction]
+
+            # Retrace the loop-erased walk, adding its cells to the tree
+            currentCell = startCell
+            while not inTree[currentCell]:
+                nextCell = neighborIds[neighborStart[currentCell] + nextDirection[currentCell]]
+                addToTree(currentCell)
+                yield (self.WALL_REMOVED, cellCoords[currentCell], cellCoords[nextCell])
+                yield (self.CELL_VISITED, cellCoords[currentCell], None)
                 currentCell = nextCell
-            
-            # Create the maze path by removing walls between cells in the path
-            for i in range(len(path) - 1):
-                maze.removeWall(path[i], path[i + 1])
-                maze.removeWall(path[i + 1], path[i + 1])
-                visitedCells.add(path[i])
-                visitedCells.add(path[i + 1])
 
-            # Remove visited cells from cellNeighbors
-            cellNeighbors = {cell: neighbors for cell, neighbors in cellNeighbors.items() if cell not in visitedCells}
+    def cellOffsets(self, levelDims) -> List[int]:
+        """
+        Compute the number of the first cell of each level.
+
+        Parameters:
+        levelDims (list): The (rowNum, colNum) of each level.
 
-        self.m_mazeGenerated = True
+        Returns:
+        list: The number of the first cell of each level, followed by the total number of cells.
+        """
+        offsets = [0]
+        for rowNum, colNum in levelDims:
+            offsets.append(offsets[-1] + rowNum * colNum)
+        return offsets
 
-    def coordinateExists(self, coord: Coordinates3D, maze: Maze3D) -> bool:
+    def buildNeighbors(self, levelDims, levelOffsets):
         """
-        Check if the given coordinate exists within the maze boundaries.
-        
+        Build the neighbours of every cell, in the same order as maze.neighbours() lists them.
+
         Parameters:
-        coord (Coordinates3D): The coordinate to check.
-        maze (Maze3D): The maze object.
-        
+        levelDims (list): The (rowNum, colNum) of each level.
+        levelOffsets (list): The number of the first cell of each level, see cellOffsets().
+
         Returns:
-        bool: True if the coordinate exists within the maze boundaries, False otherwise.
+        tuple: Arrays (neighborStart, neighborIds), where the neighbours of cell i are
+        neighborIds[neighborStart[i]:neighborStart[i+1]].
         """
-        return (0 <= coord.getLevel() < maze.levelNum() and
-                0 <= coord.getRow() < maze.rowNum(coord.getLevel()) and
-                0 <= coord.getCol() < maze.colNum(coord.getLevel()))
+        neighborStart = array('i', [0])
+        neighborIds = array('i')
+        levelNum = len(levelDims)
+        for level, (rowNum, colNum) in enumerate(levelDims):
+            offset = levelOffsets[level]
+            lowerDims = levelDims[level - 1] if level > 0 else (0, 0)
+            upperDims = levelDims[level + 1] if level + 1 < levelNum else (0, 0)
+            for row in range(rowNum):
+                for col in range(colNum):
+                    cell = offset + row * colNum + col
+                    if col > 0:
+                        neighborIds.append(cell - 1)
+                    if col + 1 < colNum:
+                        neighborIds.append(cell + 1)
+                    if row > 0:
+                        neighborIds.append(cell - colNum)
+                    if row + 1 < rowNum:
+                        neighborIds.append(cell + colNum)
+                    if row < lowerDims[0] and col < lowerDims[1]:
+                        neighborIds.append(levelOffsets[level - 1] + row * lowerDims[1] + col)
+                    if row < upperDims[0] and col < upperDims[1]:
+                        neighborIds.append(levelOffsets[level + 1] + row * upperDims[1] + col)
+                    neighborStart.append(len(neighborIds))
+
+        return neighborStart, neighborIds
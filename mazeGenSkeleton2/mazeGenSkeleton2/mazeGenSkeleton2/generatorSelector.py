@@ -11,6 +11,11 @@ from generation.mazeGenerator import MazeGenerator
 from generation.recurBackGenerator import RecurBackMazeGenerator
 from generation.primGenerator import PrimMazeGenerator
 from generation.wilsonGenerator import WilsonMazeGenerator
+from generation.kruskalGenerator import KruskalMazeGenerator
+from generation.ellerGenerator import EllerMazeGenerator
+from generation.parallelGenerator import ParallelLevelMazeGenerator
+from generation.recurDivisionGenerator import RecursiveDivisionMazeGenerator
+from generation.vectorisedGenerators import BinaryTreeMazeGenerator, SidewinderMazeGenerator
 from generation.taskDMazeGenerator import TaskDMazeGenerator
 from solving.mazeSolver import MazeSolver
 
@@ -36,8 +41,24 @@ class GeneratorSelector:
             generator = RecurBackMazeGenerator()
         elif genApproach == 'prim':
             generator = PrimMazeGenerator()
+        elif genApproach == 'primWeighted':
+            generator = PrimMazeGenerator(weighted=True)
         elif genApproach == 'wilson':
             generator = WilsonMazeGenerator()
+        elif genApproach == 'kruskal':
+            generator = KruskalMazeGenerator()
+        elif genApproach == 'eller':
+            generator = EllerMazeGenerator()
+        elif genApproach == 'binarytree':
+            generator = BinaryTreeMazeGenerator()
+        elif genApproach == 'sidewinder':
+            generator = SidewinderMazeGenerator()
+        elif genApproach == 'division':
+            generator = RecursiveDivisionMazeGenerator()
+        elif genApproach == 'parallel':
+            generator = ParallelLevelMazeGenerator()
+        elif genApproach == 'tiled':
+            generator = ParallelLevelMazeGenerator(tileSize=256)
         # TODO: If you implement other generators, you can add them here
 
         return generator
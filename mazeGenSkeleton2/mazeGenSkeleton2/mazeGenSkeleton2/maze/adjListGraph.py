@@ -7,7 +7,7 @@
 # ------------------------------------------------------------------------
 
 
-from typing import List
+from typing import Iterable, List, Tuple
 
 from maze.util import Coordinates3D, WallCoordinates
 from maze.graph import Graph
@@ -82,6 +82,31 @@ class AdjListGraph(Graph):
 
 
 
+    def updateWalls(self, pairs:Iterable[Tuple[Coordinates3D, Coordinates3D]], wallStatus:bool)->int:
+
+        vertListMap = self.m_vertListMap
+        updated: int = 0
+        for (vert1, vert2) in pairs:
+            neighs1 = vertListMap.get(vert1)
+            neighs2 = vertListMap.get(vert2)
+            if neighs1 is None or neighs2 is None:
+                continue
+
+            # single scan of each list, rather than checking hasEdge() first
+            for i in range(len(neighs1)):
+                if neighs1[i][0] == vert2:
+                    neighs1[i] = (vert2, wallStatus)
+                    for j in range(len(neighs2)):
+                        if neighs2[j][0] == vert1:
+                            neighs2[j] = (vert1, wallStatus)
+                            break
+                    updated += 1
+                    break
+
+        return updated
+
+
+
     def removeEdge(self, vert1:Coordinates3D, vert2:Coordinates3D)->bool:
         
         if self.hasEdge(vert1, vert2):
@@ -131,6 +156,23 @@ class AdjListGraph(Graph):
         
     
 
+    def getWallStatuses(self, pairs:Iterable[Tuple[Coordinates3D, Coordinates3D]])->List[bool]:
+
+        vertListMap = self.m_vertListMap
+        statuses: List[bool] = list()
+        for (vert1, vert2) in pairs:
+            status: bool = False
+            if vert2 in vertListMap:
+                for (neigh, bEdge) in vertListMap.get(vert1, []):
+                    if neigh == vert2:
+                        status = bEdge
+                        break
+            statuses.append(status)
+
+        return statuses
+
+
+
     def neighbours(self, label:Coordinates3D)->List[Coordinates3D]:
 
         if self.hasVertex(label):
@@ -148,4 +190,125 @@ class AdjListGraph(Graph):
 
 
     def vertices(self)->List[Coordinates3D]:
-        return self.m_vertListMap.keys()
\ No newline at end of file
+        return self.m_vertListMap.keys()
+
+
+
+class IndexedAdjListGraph(AdjListGraph):
+    """
+    Represents an undirected graph, as an adjacency list where the neighbours of each vertex are indexed.
+    Each vertex maps to a dictionary of neighbour -> wall status, so edge and wall lookups are a single hash
+    probe rather than a scan of the neighbour list.  Dictionaries keep insertion order, so neighbours are
+    listed in the same order as AdjListGraph.
+    """
+
+    def __init__(self):
+
+        # dictionary where the keys are source vertices, and the values are dictionaries of neighbouring vertex
+        # to whether there is a wall between them.
+        self.m_vertListMap :dict[Coordinates3D,dict[Coordinates3D,bool]] = {}
+
+
+
+    def addVertex(self, label:Coordinates3D):
+
+        if label not in self.m_vertListMap:
+            self.m_vertListMap[label] = {}
+
+
+
+    def addEdge(self, vert1:Coordinates3D, vert2:Coordinates3D, addWall:bool = False)->bool:
+
+        neighs1 = self.m_vertListMap.get(vert1)
+        neighs2 = self.m_vertListMap.get(vert2)
+        if neighs1 is None or neighs2 is None or vert2 in neighs1:
+            return False
+
+        neighs1[vert2] = addWall
+        neighs2[vert1] = addWall
+        return True
+
+
+
+    def updateWall(self, vert1:Coordinates3D, vert2:Coordinates3D, wallStatus:bool)->bool:
+
+        neighs1 = self.m_vertListMap.get(vert1)
+        if neighs1 is None or vert2 not in neighs1:
+            return False
+
+        neighs1[vert2] = wallStatus
+        self.m_vertListMap[vert2][vert1] = wallStatus
+        return True
+
+
+
+    def updateWalls(self, pairs:Iterable[Tuple[Coordinates3D, Coordinates3D]], wallStatus:bool)->int:
+
+        vertListMap = self.m_vertListMap
+        updated: int = 0
+        for (vert1, vert2) in pairs:
+            neighs1 = vertListMap.get(vert1)
+            if neighs1 is not None and vert2 in neighs1:
+                neighs1[vert2] = wallStatus
+                vertListMap[vert2][vert1] = wallStatus
+                updated += 1
+
+        return updated
+
+
+
+    def removeEdge(self, vert1:Coordinates3D, vert2:Coordinates3D)->bool:
+
+        neighs1 = self.m_vertListMap.get(vert1)
+        if neighs1 is None or vert2 not in neighs1:
+            return False
+
+        del neighs1[vert2]
+        del self.m_vertListMap[vert2][vert1]
+        return True
+
+
+
+    def hasEdge(self, vert1:Coordinates3D, vert2:Coordinates3D)->bool:
+
+        neighs1 = self.m_vertListMap.get(vert1)
+        return neighs1 is not None and vert2 in neighs1
+
+
+
+    def getWallStatus(self, vert1:Coordinates3D, vert2:Coordinates3D)->bool:
+
+        neighs1 = self.m_vertListMap.get(vert1)
+        if neighs1 is None:
+            return False
+
+        # all other cases return False
+        return neighs1.get(vert2, False)
+
+
+
+    def getWallStatuses(self, pairs:Iterable[Tuple[Coordinates3D, Coordinates3D]])->List[bool]:
+
+        vertListMap = self.m_vertListMap
+        emptyNeighs: dict = {}
+        return [vertListMap.get(vert1, emptyNeighs).get(vert2, False) for (vert1, vert2) in pairs]
+
+
+
+    def neighbours(self, label:Coordinates3D)->List[Coordinates3D]:
+
+        neighs = self.m_vertListMap.get(label)
+        if neighs is None:
+            return []
+
+        return list(neighs)
+
+
+
+    def neighbourWalls(self, label:Coordinates3D)->List[WallCoordinates]:
+
+        neighs = self.m_vertListMap.get(label)
+        if neighs is None:
+            return []
+
+        return [(label, neigh) for (neigh, hasWall) in neighs.items() if hasWall]
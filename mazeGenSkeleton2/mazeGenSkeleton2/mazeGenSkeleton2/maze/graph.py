@@ -7,7 +7,7 @@
 # -------------------------------------------------
 
 
-from typing import List
+from typing import Iterable, List, Tuple
 
 from maze.util import Coordinates3D, WallCoordinates
 
@@ -65,6 +65,25 @@ class Graph:
 
 
 
+    def updateWalls(self, pairs:Iterable[Tuple[Coordinates3D, Coordinates3D]], wallStatus:bool)->int:
+        """
+        Sets the edge weight/bool of many edges at once.  Edges that don't exist are skipped.
+        Implementations should override this with a version that avoids the per edge overhead of updateWall().
+
+        @param pairs: (source, target) vertex labels of the edges to set.
+        @param wallStatus: Whether to set wall or not.  True to set/add wall.
+
+        @returns Number of edges whose weight/bool was set.
+        """
+        updated: int = 0
+        for (vert1, vert2) in pairs:
+            if self.updateWall(vert1, vert2, wallStatus):
+                updated += 1
+
+        return updated
+
+
+
     def removeEdge(self, vert1:Coordinates3D, vert2:Coordinates3D)->bool:
         """
         Removes edge.  Edge must exist for the operation to succeed.
@@ -116,6 +135,19 @@ class Graph:
 
 
 
+    def getWallStatuses(self, pairs:Iterable[Tuple[Coordinates3D, Coordinates3D]])->List[bool]:
+        """
+        Gets the edge bool/weight of many edges at once.
+        Implementations should override this with a version that avoids the per edge overhead of getWallStatus().
+
+        @param pairs: (source, target) vertex labels of the edges to retrieve.
+
+        @returns List with the edge bool/weight of each pair, False where the edge doesn't exist.
+        """
+        return [self.getWallStatus(vert1, vert2) for (vert1, vert2) in pairs]
+
+
+
     def neighbours(self, label:Coordinates3D)->List[Coordinates3D]:
         """
         Retrieves all the neighbours of vertex/label.
@@ -128,6 +160,22 @@ class Graph:
 
 
 
+    def openNeighbours(self, label:Coordinates3D)->List[Coordinates3D]:
+        """
+        Retrieves the neighbours of vertex/label that don't have a wall between them and the vertex.
+        Implementations can override this with a version that doesn't look up the walls one edge at a time.
+
+        @param label: Label of vertex to obtain neighbours.
+
+        @returns List of neighbouring vertices without a wall, in the same order as neighbours().
+        """
+        neighbours: List[Coordinates3D] = self.neighbours(label)
+
+        return [neigh for (neigh, hasWall) in zip(neighbours, self.getWallStatuses([(label, neigh) for neigh in neighbours]))
+                if not hasWall]
+
+
+
     def neighbourWalls(self, label:Coordinates3D)->List[WallCoordinates]:
         """
         Retrieves list of neighbouring walls.
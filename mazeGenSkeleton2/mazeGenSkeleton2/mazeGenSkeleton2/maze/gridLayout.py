@@ -0,0 +1,125 @@
+# -------------------------------------------------
+# Flat index layout for the vertices of a 3D maze.
+#
+# __copyright__ = 'Copyright 2024, RMIT University'
+# -------------------------------------------------
+
+
+from bisect import bisect_right
+from typing import List, Tuple
+
+from maze.util import Coordinates3D
+
+
+class GridLayout:
+    """
+    Maps the coordinates of a 3D maze onto a flat range of integer indices, so per vertex information can be
+    stored in arrays rather than dictionaries.
+
+    Each level is stored as a row-major rectangle that is padded by one row/column on every side, so the
+    boundary vertices (rows -1 and rowNum, columns -1 and colNum) also have an index.  A level is additionally
+    extended to cover the cells of the levels directly below and above it, as Maze3D.initCells() adds vertices
+    there to mark the boundary between levels of different sizes.
+    """
+
+    def __init__(self, levelDims: List[Tuple[int, int]]):
+        """
+        Constructor.
+
+        @param levelDims: list of (rowNum, colNum) tuples, one for each level, same as for Maze3D.
+        """
+        levelNum: int = len(levelDims)
+
+        # self.m_heights, self.m_widths: number of stored rows and columns for each level, including padding.
+        self.m_heights: List[int] = list()
+        self.m_widths: List[int] = list()
+        # self.m_levelOffsets: index of vertex (level, -1, -1) for each level.
+        self.m_levelOffsets: List[int] = list()
+
+        size: int = 0
+        for level, (rowNum, colNum) in enumerate(levelDims):
+            maxRow: int = rowNum
+            maxCol: int = colNum
+            # cells of the adjacent levels, which have a vertex on this level above/below them
+            for adjLevel in (level-1, level+1):
+                if 0 <= adjLevel < levelNum:
+                    maxRow = max(maxRow, levelDims[adjLevel][0] - 1)
+                    maxCol = max(maxCol, levelDims[adjLevel][1] - 1)
+
+            # rows/columns -1 to maxRow/maxCol inclusive
+            self.m_heights.append(maxRow + 2)
+            self.m_widths.append(maxCol + 2)
+            self.m_levelOffsets.append(size)
+            size += (maxRow + 2) * (maxCol + 2)
+
+        self.m_size: int = size
+
+
+
+    def size(self)->int:
+        """
+        @returns Number of indices in the layout.
+        """
+        return self.m_size
+
+
+
+    def levelNum(self)->int:
+        """
+        @returns Number of levels in the layout.
+        """
+        return len(self.m_levelOffsets)
+
+
+
+    def width(self, level: int)->int:
+        """
+        @param level: Level we want the stored width of.
+
+        @returns Number of stored columns of level, including padding.  Moving one column is +/- 1 index.
+        """
+        return self.m_widths[level]
+
+
+
+    def index(self, level: int, row: int, col: int)->int:
+        """
+        @param level: Level of vertex.
+        @param row: Row of vertex.
+        @param col: Column of vertex.
+
+        @returns Index of the vertex, or -1 if it lies outside the layout.
+        """
+        if level < 0 or level >= len(self.m_levelOffsets):
+            return -1
+
+        width: int = self.m_widths[level]
+        if row < -1 or row >= self.m_heights[level] - 1 or col < -1 or col >= width - 1:
+            return -1
+
+        return self.m_levelOffsets[level] + (row + 1) * width + col + 1
+
+
+
+    def coordIndex(self, coord: Coordinates3D)->int:
+        """
+        @param coord: Coordinates of vertex.
+
+        @returns Index of the vertex, or -1 if it lies outside the layout.
+        """
+        return self.index(coord.getLevel(), coord.getRow(), coord.getCol())
+
+
+
+    def coordinates(self, index: int)->Coordinates3D:
+        """
+        @param index: Index of vertex, as returned by index().
+
+        @returns Coordinates of the vertex stored at index.
+        """
+        assert(index >= 0 and index < self.m_size)
+
+        level: int = bisect_right(self.m_levelOffsets, index) - 1
+        (row, col) = divmod(index - self.m_levelOffsets[level], self.m_widths[level])
+
+        return Coordinates3D(level, row - 1, col - 1)
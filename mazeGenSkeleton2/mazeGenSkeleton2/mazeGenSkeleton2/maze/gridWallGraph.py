@@ -0,0 +1,430 @@
+# ------------------------------------------------------------------------
+# Array backed grid implementation of the graph interface.
+#
+# __copyright__ = 'Copyright 2024, RMIT University'
+# ------------------------------------------------------------------------
+
+
+from typing import Iterable, List, Tuple
+
+# NumPy is optional, it only speeds up clearPassages().
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from maze.util import Coordinates3D, WallCoordinates
+from maze.graph import Graph
+from maze.gridLayout import GridLayout
+
+
+class GridWallGraph(Graph):
+    """
+    Represents an undirected graph whose vertices are the cells of a 3D grid, and whose edges only join cells
+    that are adjacent in one of the six directions.
+
+    Rather than a dictionary of neighbour lists, each level is stored in flat arrays (see GridLayout), with one
+    byte per vertex for each of:
+        - which of the six edges exist, plus a flag for whether the vertex exists, and
+        - a 6-bit mask of which of those edges have a wall.
+    Edge and wall queries are then index arithmetic and a bit test.
+
+    In implicit mode, the first array is not stored either.  The vertices and edges are instead derived from the
+    level dimensions, following the same topology as Maze3D.initCells() builds, and only the walls are stored.
+    The topology is then fixed, so adding or removing vertices and edges has no effect.
+    """
+
+    # Direction bits.  Row increases towards the north (the top of the visualisation), level increases upwards.
+    WEST = 0
+    EAST = 1
+    SOUTH = 2
+    NORTH = 3
+    DOWN = 4
+    UP = 5
+
+    # (level, row, col) offset of each direction, ordered by direction bit.  This is also the order that
+    # Maze3D.initCells() adds edges in, so neighbours are listed in the same order as in AdjListGraph.
+    DIRECTION_DELTAS: List[Tuple[int, int, int]] = [(0, 0, -1), (0, 0, 1), (0, -1, 0), (0, 1, 0), (-1, 0, 0), (1, 0, 0)]
+
+    # direction on the other side of an edge, indexed by direction bit.
+    OPPOSITE: List[int] = [EAST, WEST, NORTH, SOUTH, UP, DOWN]
+
+    # flag in the link mask indicating the vertex exists.
+    VERTEX_FLAG = 0x40
+
+    # full 6-bit wall/edge mask.
+    ALL_DIRECTIONS = 0x3f
+
+
+
+    def __init__(self, levelDims: List[Tuple[int, int]], implicit: bool = False):
+        """
+        Constructor.
+
+        @param levelDims: list of (rowNum, colNum) tuples, one for each level, same as for Maze3D.
+        @param implicit: Whether to derive the vertices and edges from levelDims rather than store them.
+            Default is False.
+        """
+
+        self.m_levelDims: List[Tuple[int, int]] = levelDims
+
+        # self.m_layout: maps coordinates to array indices.
+        self.m_layout: GridLayout = GridLayout(levelDims)
+
+        # self.m_links: for each vertex, bit d is set if there is an edge in direction d, and VERTEX_FLAG if the
+        # vertex exists.  None in implicit mode.
+        self.m_links: bytearray = None if implicit else bytearray(self.m_layout.size())
+
+        # self.m_walls: for each vertex, bit d is set if the edge in direction d has a wall.  In implicit mode bits
+        # may also be set for edges that don't exist, these are ignored.
+        self.m_walls: bytearray = bytearray(self.m_layout.size())
+
+        # maps (level, row, col) offset to direction bit
+        self.m_deltaDirection: dict[Tuple[int, int, int], int] = {delta: d for (d, delta) in enumerate(self.DIRECTION_DELTAS)}
+
+
+
+    def isImplicit(self)->bool:
+        """
+        @returns True if the vertices and edges are derived from the level dimensions rather than stored.
+        """
+        return self.m_links is None
+
+
+
+    def initWalls(self, addWall: bool):
+        """
+        Sets the walls of every edge at once.  This is all the initialisation an implicit graph needs.
+
+        @param addWall: Whether there should be a wall between all adjacent cells.
+        """
+        if addWall:
+            self.m_walls = bytearray([self.ALL_DIRECTIONS]) * self.m_layout.size()
+        else:
+            self.m_walls = bytearray(self.m_layout.size())
+
+
+
+    def addVertex(self, label:Coordinates3D):
+
+        # vertices outside the layout cannot be stored, and are not part of any maze built by Maze3D
+        index: int = self.m_layout.coordIndex(label)
+        if index >= 0 and self.m_links is not None:
+            self.m_links[index] |= self.VERTEX_FLAG
+
+
+
+    def addVertices(self, vertLabels:List[Coordinates3D]):
+
+        for label in vertLabels:
+            self.addVertex(label)
+
+
+
+    def addEdge(self, vert1:Coordinates3D, vert2:Coordinates3D, addWall:bool = False)->bool:
+
+        if self.m_links is None or not (self.hasVertex(vert1) and self.hasVertex(vert2)):
+            return False
+
+        # only edges between adjacent cells can be represented
+        direction: int = self.direction(vert1, vert2)
+        if direction < 0:
+            return False
+
+        index1: int = self.m_layout.coordIndex(vert1)
+        if self.m_links[index1] & (1 << direction):
+            return False
+
+        index2: int = self.m_layout.coordIndex(vert2)
+        opposite: int = self.OPPOSITE[direction]
+        self.m_links[index1] |= 1 << direction
+        self.m_links[index2] |= 1 << opposite
+        if addWall:
+            self.m_walls[index1] |= 1 << direction
+            self.m_walls[index2] |= 1 << opposite
+
+        return True
+
+
+
+    def updateWall(self, vert1:Coordinates3D, vert2:Coordinates3D, wallStatus:bool)->bool:
+
+        if not self.hasEdge(vert1, vert2):
+            return False
+
+        direction: int = self.direction(vert1, vert2)
+        index1: int = self.m_layout.coordIndex(vert1)
+        index2: int = self.m_layout.coordIndex(vert2)
+        opposite: int = self.OPPOSITE[direction]
+        if wallStatus:
+            self.m_walls[index1] |= 1 << direction
+            self.m_walls[index2] |= 1 << opposite
+        else:
+            self.m_walls[index1] &= ~(1 << direction)
+            self.m_walls[index2] &= ~(1 << opposite)
+
+        return True
+
+
+
+    def updateWalls(self, pairs:Iterable[Tuple[Coordinates3D, Coordinates3D]], wallStatus:bool)->int:
+
+        walls = self.m_walls
+        opposites: List[int] = self.OPPOSITE
+        updated: int = 0
+        for (vert1, vert2) in pairs:
+            direction: int = self.direction(vert1, vert2)
+            if direction < 0:
+                continue
+            index1: int = self.m_layout.coordIndex(vert1)
+            if index1 < 0 or not (self.linkMask(vert1, index1) & (1 << direction)):
+                continue
+
+            index2: int = self.m_layout.coordIndex(vert2)
+            if wallStatus:
+                walls[index1] |= 1 << direction
+                walls[index2] |= 1 << opposites[direction]
+            else:
+                walls[index1] &= ~(1 << direction)
+                walls[index2] &= ~(1 << opposites[direction])
+            updated += 1
+
+        return updated
+
+
+
+    def clearPassages(self, level: int, rowNum: int, colNum: int, passages: bytes):
+        """
+        Removes the walls of the east and north edges of the cells of a level, given as a byte per cell.  With NumPy
+        the whole level is cleared at once with boolean masks, otherwise one cell at a time.
+
+        @param level: Level of the cells.
+        @param rowNum: Number of rows of the level.
+        @param colNum: Number of columns of the level.
+        @param passages: One byte per cell in row-major order, with direction bits EAST and/or NORTH set for the
+            walls to remove.  The edges must exist.
+        """
+        if np is not None:
+            self._clearPassagesNumPy(level, rowNum, colNum, passages)
+            return
+
+        walls = self.m_walls
+        width: int = self.m_layout.width(level)
+        eastBit: int = 1 << self.EAST
+        northBit: int = 1 << self.NORTH
+        eastMask: int = ~eastBit
+        westMask: int = ~(1 << self.WEST)
+        northMask: int = ~northBit
+        southMask: int = ~(1 << self.SOUTH)
+
+        for row in range(rowNum):
+            index: int = self.m_layout.index(level, row, 0)
+            cell: int = row * colNum
+            for passage in passages[cell:cell + colNum]:
+                if passage & eastBit:
+                    walls[index] &= eastMask
+                    walls[index + 1] &= westMask
+                if passage & northBit:
+                    walls[index] &= northMask
+                    walls[index + width] &= southMask
+                index += 1
+
+
+
+    def _clearPassagesNumPy(self, level: int, rowNum: int, colNum: int, passages: bytes):
+        """
+        clearPassages() on a NumPy view of the wall masks, see there for the parameters.
+        """
+        carved = np.frombuffer(passages, dtype=np.uint8).reshape(rowNum, colNum)
+        eastOpen = (carved & np.uint8(1 << self.EAST)) != 0
+        northOpen = (carved & np.uint8(1 << self.NORTH)) != 0
+
+        # the level as stored, including padding, so cell (row, col) is at [row+1, col+1]
+        walls = np.frombuffer(self.m_walls, dtype=np.uint8)
+        offset: int = self.m_layout.index(level, -1, -1)
+        width: int = self.m_layout.width(level)
+        stored = walls[offset:offset + (rowNum + 2) * width].reshape(-1, width)
+
+        cells = stored[1:rowNum+1, 1:colNum+1]
+        cells[eastOpen] &= ~np.uint8(1 << self.EAST)
+        cells[northOpen] &= ~np.uint8(1 << self.NORTH)
+        stored[1:rowNum+1, 2:colNum+2][eastOpen] &= ~np.uint8(1 << self.WEST)
+        stored[2:rowNum+2, 1:colNum+1][northOpen] &= ~np.uint8(1 << self.SOUTH)
+
+
+
+    def removeEdge(self, vert1:Coordinates3D, vert2:Coordinates3D)->bool:
+
+        if self.m_links is None or not self.hasEdge(vert1, vert2):
+            return False
+
+        direction: int = self.direction(vert1, vert2)
+        index1: int = self.m_layout.coordIndex(vert1)
+        index2: int = self.m_layout.coordIndex(vert2)
+        opposite: int = self.OPPOSITE[direction]
+        self.m_links[index1] &= ~(1 << direction)
+        self.m_links[index2] &= ~(1 << opposite)
+        self.m_walls[index1] &= ~(1 << direction)
+        self.m_walls[index2] &= ~(1 << opposite)
+
+        return True
+
+
+
+    def hasVertex(self, label:Coordinates3D)->bool:
+
+        index: int = self.m_layout.coordIndex(label)
+        return index >= 0 and (self.linkMask(label, index) & self.VERTEX_FLAG) != 0
+
+
+
+    def hasEdge(self, vert1:Coordinates3D, vert2:Coordinates3D)->bool:
+
+        # edges are only ever added between existing vertices, so checking one side is sufficient
+        direction: int = self.direction(vert1, vert2)
+        if direction < 0:
+            return False
+
+        index1: int = self.m_layout.coordIndex(vert1)
+        return index1 >= 0 and (self.linkMask(vert1, index1) & (1 << direction)) != 0
+
+
+
+    def getWallStatus(self, vert1:Coordinates3D, vert2:Coordinates3D)->bool:
+
+        if not self.hasEdge(vert1, vert2):
+            return False
+
+        return (self.m_walls[self.m_layout.coordIndex(vert1)] & (1 << self.direction(vert1, vert2))) != 0
+
+
+
+    def getWallStatuses(self, pairs:Iterable[Tuple[Coordinates3D, Coordinates3D]])->List[bool]:
+
+        walls = self.m_walls
+        statuses: List[bool] = list()
+        for (vert1, vert2) in pairs:
+            direction: int = self.direction(vert1, vert2)
+            index1: int = self.m_layout.coordIndex(vert1) if direction >= 0 else -1
+            statuses.append(index1 >= 0 and (self.linkMask(vert1, index1) & walls[index1] & (1 << direction)) != 0)
+
+        return statuses
+
+
+
+    def neighbours(self, label:Coordinates3D)->List[Coordinates3D]:
+
+        index: int = self.m_layout.coordIndex(label)
+        if index < 0:
+            return []
+
+        return self._neighboursInMask(label, self.linkMask(label, index))
+
+
+
+    def openNeighbours(self, label:Coordinates3D)->List[Coordinates3D]:
+
+        index: int = self.m_layout.coordIndex(label)
+        if index < 0:
+            return []
+
+        return self._neighboursInMask(label, self.linkMask(label, index) & ~self.m_walls[index])
+
+
+
+    def neighbourWalls(self, label:Coordinates3D)->List[WallCoordinates]:
+
+        index: int = self.m_layout.coordIndex(label)
+        if index < 0:
+            return []
+
+        return [(label, neigh) for neigh in self._neighboursInMask(label, self.linkMask(label, index) & self.m_walls[index])]
+
+
+
+    def vertices(self)->List[Coordinates3D]:
+
+        vertices: List[Coordinates3D] = list()
+        for index in range(self.m_layout.size()):
+            coord: Coordinates3D = self.m_layout.coordinates(index)
+            if self.linkMask(coord, index) & self.VERTEX_FLAG:
+                vertices.append(coord)
+
+        return vertices
+
+
+
+    def linkMask(self, label:Coordinates3D, index:int)->int:
+        """
+        @param label: Vertex to get the edges of.
+        @param index: Index of label in the layout.
+
+        @returns Direction bits of the edges of label, plus VERTEX_FLAG if label is a vertex.
+        """
+        if self.m_links is not None:
+            return self.m_links[index]
+
+        # implicit mode, derive the same edges Maze3D.initCells() adds
+        level: int = label.getLevel()
+        row: int = label.getRow()
+        col: int = label.getCol()
+        (rowNum, colNum) = self.m_levelDims[level]
+
+        mask: int = 0
+        # edges along rows and columns, between cells and to the boundary
+        # (row and col are at least -1, as label is in the layout)
+        if 0 <= row < rowNum:
+            if col < colNum:
+                mask |= 1 << self.EAST
+            if 0 <= col <= colNum:
+                mask |= 1 << self.WEST
+        if 0 <= col < colNum:
+            if row < rowNum:
+                mask |= 1 << self.NORTH
+            if 0 <= row <= rowNum:
+                mask |= 1 << self.SOUTH
+
+        # edges between levels, wherever there is a cell on either side
+        isCell: bool = 0 <= row < rowNum and 0 <= col < colNum
+        if level > 0:
+            (lowerRowNum, lowerColNum) = self.m_levelDims[level-1]
+            if isCell or (0 <= row < lowerRowNum and 0 <= col < lowerColNum):
+                mask |= 1 << self.DOWN
+        if level + 1 < len(self.m_levelDims):
+            (upperRowNum, upperColNum) = self.m_levelDims[level+1]
+            if isCell or (0 <= row < upperRowNum and 0 <= col < upperColNum):
+                mask |= 1 << self.UP
+
+        # all vertices have at least one edge
+        if mask != 0:
+            mask |= self.VERTEX_FLAG
+
+        return mask
+
+
+
+    def direction(self, vert1:Coordinates3D, vert2:Coordinates3D)->int:
+        """
+        @param vert1: Source vertex.
+        @param vert2: Target vertex.
+
+        @returns Direction bit of the step from vert1 to vert2, or -1 if they are not adjacent.
+        """
+        return self.m_deltaDirection.get((vert2.getLevel() - vert1.getLevel(), vert2.getRow() - vert1.getRow(),
+                                          vert2.getCol() - vert1.getCol()), -1)
+
+
+
+    def _neighboursInMask(self, label:Coordinates3D, mask:int)->List[Coordinates3D]:
+        """
+        @param label: Vertex to list the neighbours of.
+        @param mask: Direction bits of the neighbours to list.
+
+        @returns Neighbours of label in the directions set in mask, in direction order.
+        """
+        level: int = label.getLevel()
+        row: int = label.getRow()
+        col: int = label.getCol()
+
+        return [Coordinates3D(level + dl, row + dr, col + dc) for (d, (dl, dr, dc)) in enumerate(self.DIRECTION_DELTAS)
+                if mask & (1 << d)]
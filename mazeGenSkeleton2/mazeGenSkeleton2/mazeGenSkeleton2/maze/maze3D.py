@@ -6,12 +6,19 @@
 # __copyright__ = 'Copyright 2024, RMIT University'
 # -------------------------------------------------
 
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
+from array import array
 from enum import Enum
+import copy
+import mmap as mmapModule
+import struct
 
 from maze.util import Coordinates3D, WallCoordinates
 from maze.graph import Graph
-from maze.adjListGraph import AdjListGraph
+from maze.adjListGraph import AdjListGraph, IndexedAdjListGraph
+from maze.gridWallGraph import GridWallGraph
+from maze.gridLayout import GridLayout
+from maze.overlayGraph import OverlayGraph
 
 
 
@@ -30,15 +37,35 @@ class Maze3D:
         COL_NUM = 1
 
 
+    # Names of the graph implementations that can be used to store the maze.
+    # 'adjList': AdjListGraph, adjacency lists keyed by coordinates.
+    # 'indexedAdjList': IndexedAdjListGraph, adjacency lists with a dictionary of neighbours per cell.
+    # 'grid': GridWallGraph, flat arrays with a wall bit mask per cell.
+    # 'implicit': GridWallGraph in implicit mode, the neighbourhoods are computed from the level dimensions and
+    #     only the walls are stored.
+    GRAPH_TYPES = ('adjList', 'indexedAdjList', 'grid', 'implicit')
 
-    def __init__(self, levelDims: List[Tuple[int, int]]):
+    # Magic bytes and version at the start of files written by save().
+    FILE_MAGIC = b'MZ3D'
+    FILE_VERSION = 1
+
+    # Bits of a passage map (see removeLevelPassages()), marking a passage from a cell to its east and north
+    # neighbour.  Same as the direction bits of GridWallGraph, so passage maps apply directly to its wall masks.
+    PASSAGE_EAST = 1 << GridWallGraph.EAST
+    PASSAGE_NORTH = 1 << GridWallGraph.NORTH
+
+
+
+    def __init__(self, levelDims: List[Tuple[int, int]], graphType: str = 'adjList'):
         """
         Constructor.
 
         @param levelDims: list of tuples storing the specifications of each level in our maze, starting at level 0.
             Each tuple is (rowNum, colNum), where rowNum and colNum are the number of rows and columns for that level.
             The left, bottom cell for each level is always (0,0).
+        @param graphType: Which graph implementation to store the maze in, one of GRAPH_TYPES.  Default is 'adjList'.
         """
+        assert(graphType in self.GRAPH_TYPES)
 
         # (rowNum, colNum)
         # self.m_levelDims: stores the dimensions/specifications for each level in this 3D maze.  
@@ -48,18 +75,70 @@ class Maze3D:
         self.m_entrance: List[Coordinates3D] = list()
         self.m_exit: List[Coordinates3D] = list()
 
-        # self.m_graph: We use an adjacency list representation to store our neighbourhoods and wall information.
-        self.m_graph : Graph = AdjListGraph()
+        # name of the generator and random seed used to generate the maze, if known.  Stored in the file by save().
+        self.m_generatorName: str = None
+        self.m_randSeed: int = None
+
+        # self.m_passableCache: cell -> neighbours of the cell without a wall between them.  Filled in lazily by
+        # passableNeighbours(), and kept up to date by the wall changing methods of this class.
+        self.m_passableCache: dict[Coordinates3D, Tuple[Coordinates3D, ...]] = {}
+
+        # self.m_exitField: (distances, next hops) to the nearest exit, see exitField().  Computed on first use, and
+        # reset to None by every change of the walls or exits made through this class.
+        self.m_exitField: Tuple[array, array] = None
+
+        # self.m_layout: Flat index layout of the vertices, see layout().  Created on first use.
+        self.m_layout: GridLayout = None
 
+        # self.m_graphType: Name of the graph implementation, one of GRAPH_TYPES.
+        self.m_graphType: str = graphType
 
+        # self.m_graph: We use a graph to store our neighbourhoods and wall information, by default an adjacency list.
+        self.m_graph : Graph = self._newGraph()
 
-    def initCells(self, addWallFlag:bool = False):
+
+
+    def _newGraph(self)->Graph:
+        """
+        @returns New, empty graph of the maze's graph type.
+        """
+        if self.m_graphType == 'grid':
+            return GridWallGraph(self.m_levelDims)
+        elif self.m_graphType == 'implicit':
+            return GridWallGraph(self.m_levelDims, implicit=True)
+        elif self.m_graphType == 'indexedAdjList':
+            return IndexedAdjListGraph()
+        else:
+            return AdjListGraph()
+
+
+
+    def initCells(self, addWallFlag:bool = False, openLevels:bool = False):
         """
         Initialises the cells in the maze. 
 
         @param addWallFlag: Whether we should also add the walls between all adjacent cells as we are initiasing
             the maze.  Default is False.
-        """
+        @param openLevels: Whether to leave out the walls between two cells of the same level when adding walls, so
+            each level is a single open room, walled in by its boundary and walled off from the other levels.
+            Default is False.
+        """
+
+        self.m_passableCache.clear()
+        self.m_exitField = None
+
+        # snapshots and forks share their walls with another maze, so start again with a graph of our own
+        if isinstance(self.m_graph, OverlayGraph):
+            self.m_graph.checkWritable()
+            self.m_graph = self._newGraph()
+
+        # the implicit graph already knows the cells and neighbourhoods, only need to set the walls
+        if self.m_graphType == 'implicit':
+            self.m_graph.initWalls(addWallFlag)
+            if addWallFlag and openLevels:
+                for level, (rowNum, colNum) in enumerate(self.m_levelDims):
+                    self.m_graph.clearPassages(level, rowNum, colNum, self._openLevelPassages(rowNum, colNum))
+            return
         
         # Loop through each level, and add the cells/vertices and neighbourhoods/edges to the graph representation.
         for level, (rowNum, colNum) in enumerate(self.m_levelDims):
@@ -74,12 +153,14 @@ class Maze3D:
             # Scan across rows first and add edges between cells of each row
             for row in range(0, rowNum):
                 for col in range(-1, colNum):
-                    self.m_graph.addEdge(Coordinates3D(level,row,col), Coordinates3D(level,row,col+1), addWallFlag)
+                    wallFlag: bool = addWallFlag and not (openLevels and 0 <= col < colNum - 1)
+                    self.m_graph.addEdge(Coordinates3D(level,row,col), Coordinates3D(level,row,col+1), wallFlag)
 
             # scan columns now and add edges between cells of each column
             for col in range(0, colNum):
                 for row in range(-1, rowNum):
-                    self.m_graph.addEdge(Coordinates3D(level,row,col), Coordinates3D(level,row+1,col), addWallFlag)
+                    wallFlag: bool = addWallFlag and not (openLevels and 0 <= row < rowNum - 1)
+                    self.m_graph.addEdge(Coordinates3D(level,row,col), Coordinates3D(level,row+1,col), wallFlag)
 
         # add edges between cells of different levels
         # should only do this after creation of vertices/cells
@@ -110,6 +191,21 @@ class Maze3D:
                         
                         
 
+    def _openLevelPassages(self, rowNum: int, colNum: int)->bytes:
+        """
+        @param rowNum: Number of rows of a level.
+        @param colNum: Number of columns of a level.
+
+        @returns Passage map (see removeLevelPassages()) with a passage between every two adjacent cells of the level.
+        """
+        both: int = self.PASSAGE_EAST | self.PASSAGE_NORTH
+        row: bytes = bytes([both]) * (colNum - 1) + bytes([self.PASSAGE_NORTH])
+        lastRow: bytes = bytes([self.PASSAGE_EAST]) * (colNum - 1) + bytes([0])
+
+        return row * (rowNum - 1) + lastRow
+
+
+
     def addWall(self, cell1:Coordinates3D, cell2:Coordinates3D):
         """
         Adds a wall between cells cell1 and cell2.
@@ -122,6 +218,9 @@ class Maze3D:
         assert(self.checkCoordinates(cell1) and self.checkCoordinates(cell2))
         
         self.m_graph.updateWall(cell1, cell2, True)
+        self.m_exitField = None
+        if self.m_passableCache:
+            self._updatePassable(cell1, cell2, False)
 
 
 
@@ -138,6 +237,131 @@ class Maze3D:
         assert(self.checkCoordinates(cell1) and self.checkCoordinates(cell2))
 
         self.m_graph.updateWall(cell1, cell2, False)
+        self.m_exitField = None
+        if self.m_passableCache:
+            self._updatePassable(cell1, cell2, True)
+
+
+
+    def addWalls(self, pairs:Iterable[Tuple[Coordinates3D, Coordinates3D]], trusted:bool = False):
+        """
+        Adds walls between many pairs of adjacent cells at once.
+
+        @param pairs: (cell1, cell2) pairs of the walls to add.
+        @param trusted: Whether the caller guarantees all cells are valid, so they are not checked.  Otherwise, all
+            cells are checked before any wall is changed.  Default is False.
+        """
+        if not trusted or self.m_passableCache:
+            pairs = self._checkPairs(pairs, trusted)
+
+        self.m_graph.updateWalls(pairs, True)
+        self.m_exitField = None
+        if self.m_passableCache:
+            for (cell1, cell2) in pairs:
+                self._updatePassable(cell1, cell2, False)
+
+
+
+    def removeWalls(self, pairs:Iterable[Tuple[Coordinates3D, Coordinates3D]], trusted:bool = False):
+        """
+        Removes walls between many pairs of adjacent cells at once, e.g., a whole carved path or spanning tree.
+
+        @param pairs: (cell1, cell2) pairs of the walls to remove.
+        @param trusted: Whether the caller guarantees all cells are valid, so they are not checked.  Otherwise, all
+            cells are checked before any wall is changed.  Default is False.
+        """
+        if not trusted or self.m_passableCache:
+            pairs = self._checkPairs(pairs, trusted)
+
+        self.m_graph.updateWalls(pairs, False)
+        self.m_exitField = None
+        if self.m_passableCache:
+            for (cell1, cell2) in pairs:
+                self._updatePassable(cell1, cell2, True)
+
+
+
+    def removeLevelPassages(self, level: int, passages: bytes):
+        """
+        Removes the walls of a whole level at once, given as a passage map, e.g., a level generated by a worker
+        process.  On the grid graphs the walls are cleared directly, without creating any coordinates.
+
+        @param level: Level to remove walls from.
+        @param passages: One byte per cell of the level in row-major order, with PASSAGE_EAST and/or PASSAGE_NORTH
+            set if the wall between the cell and its east/north neighbour should be removed.
+        """
+        (rowNum, colNum) = self.m_levelDims[level]
+        assert(len(passages) == rowNum * colNum)
+
+        if isinstance(self.m_graph, GridWallGraph) and not self.m_passableCache:
+            self.m_graph.clearPassages(level, rowNum, colNum, passages)
+            self.m_exitField = None
+            return
+
+        pairs: List[Tuple[Coordinates3D, Coordinates3D]] = list()
+        for (cell, passage) in enumerate(passages):
+            if passage:
+                (row, col) = divmod(cell, colNum)
+                if passage & self.PASSAGE_EAST:
+                    pairs.append((Coordinates3D(level, row, col), Coordinates3D(level, row, col+1)))
+                if passage & self.PASSAGE_NORTH:
+                    pairs.append((Coordinates3D(level, row, col), Coordinates3D(level, row+1, col)))
+
+        # the passages are all between cells of the level
+        self.removeWalls(pairs, trusted=True)
+
+
+
+    def hasWalls(self, pairs:Iterable[Tuple[Coordinates3D, Coordinates3D]])->List[bool]:
+        """
+        Checks if there are walls between many pairs of cells at once.
+
+        @param pairs: (cell1, cell2) pairs to check.
+
+        @returns List with True for each pair that has a wall between the two cells.
+        """
+        return self.m_graph.getWallStatuses(pairs)
+
+
+
+    def _checkPairs(self, pairs:Iterable[Tuple[Coordinates3D, Coordinates3D]], trusted:bool = False)->List[Tuple[Coordinates3D, Coordinates3D]]:
+        """
+        Checks the cells of all pairs are valid.
+
+        @param pairs: (cell1, cell2) pairs to check.
+        @param trusted: If True, the cells are not checked.  Default is False.
+
+        @returns The pairs as a list, so they can be iterated again.
+        """
+        pairs = list(pairs)
+        if not trusted:
+            for (cell1, cell2) in pairs:
+                assert(self.checkCoordinates(cell1) and self.checkCoordinates(cell2))
+
+        return pairs
+
+
+
+    def _updatePassable(self, cell1:Coordinates3D, cell2:Coordinates3D, passable:bool):
+        """
+        Updates the cached passable neighbours of cell1 and cell2 after the wall between them has changed.
+        Cells that haven't been cached are left alone.
+
+        @param cell1: One side of the changed wall.
+        @param cell2: Other side of the changed wall.
+        @param passable: True if the wall was removed, False if it was added.
+        """
+        for (cell, other) in ((cell1, cell2), (cell2, cell1)):
+            cached: Tuple[Coordinates3D, ...] = self.m_passableCache.get(cell)
+            if cached is None:
+                continue
+
+            if not passable:
+                self.m_passableCache[cell] = tuple([neigh for neigh in cached if neigh != other])
+            elif other not in cached:
+                # keep the same order as neighbours()
+                self.m_passableCache[cell] = tuple([neigh for neigh in self.m_graph.neighbours(cell)
+                                                    if neigh == other or neigh in cached])
 
 
 
@@ -151,6 +375,25 @@ class Maze3D:
 
 
 
+    def passableNeighbours(self, cell:Coordinates3D)->Tuple[Coordinates3D, ...]:
+        """
+        Neighbours of cell that can be moved to, i.e., that don't have a wall between them and cell.  These are
+        cached, so after the first call for a cell no wall lookups are needed.  The cache is only kept up to date by
+        changes made through this class, not changes made directly to the graph.
+
+        @param cell: Cell we want to find the passable neighbours for.
+
+        @returns: Tuple of passable neighbours, in the same order as neighbours().
+        """
+        passable: Tuple[Coordinates3D, ...] = self.m_passableCache.get(cell)
+        if passable is None:
+            passable = tuple(self.m_graph.openNeighbours(cell))
+            self.m_passableCache[cell] = passable
+
+        return passable
+
+
+
     def neighbourWalls(self, cell:Coordinates3D)->List[WallCoordinates]:
         """
         @param cell: Cell we want to find the adjacent walls for.
@@ -205,6 +448,7 @@ class Maze3D:
         # check if cell of exit is on the boundary of the maze, as an exit should only be added along the boundary
         if self.isBoundary(cell):
             self.m_exit.append(cell)
+            self.m_exitField = None
 
             return True
         else:
@@ -285,6 +529,84 @@ class Maze3D:
 
 
 
+    def exitField(self)->Tuple[array, array]:
+        """
+        Distance to the nearest exit of every vertex, and the neighbour to move to to get one step closer, from a
+        breadth first search from all exits at once.  Computed on first use and then cached, until the walls or exits
+        are changed through this class.
+
+        @returns (distances, next hops), arrays indexed as layout(), with the number of moves to the nearest exit and
+            the index of the next vertex on the way there.  Both are -1 for vertices that can't reach an exit, and
+            the next hop is -1 at the exits themselves.
+        """
+        if self.m_exitField is None:
+            layout: GridLayout = self.layout()
+            distances: array = array('l', [-1]) * layout.size()
+            nextHops: array = array('l', [-1]) * layout.size()
+
+            frontier: List[Coordinates3D] = list()
+            for ext in self.m_exit:
+                index: int = layout.coordIndex(ext)
+                if distances[index] < 0:
+                    distances[index] = 0
+                    frontier.append(ext)
+
+            # a layer at a time, reading the walls straight from the graph, so the passable cache isn't filled
+            distance: int = 0
+            while len(frontier) > 0:
+                distance += 1
+                nextFrontier: List[Coordinates3D] = list()
+                for cell in frontier:
+                    index = layout.coordIndex(cell)
+                    for neigh in self.m_graph.openNeighbours(cell):
+                        neighIndex: int = layout.coordIndex(neigh)
+                        if distances[neighIndex] < 0:
+                            distances[neighIndex] = distance
+                            nextHops[neighIndex] = index
+                            nextFrontier.append(neigh)
+                frontier = nextFrontier
+
+            self.m_exitField = (distances, nextHops)
+
+        return self.m_exitField
+
+
+
+    def exitDistance(self, cell: Coordinates3D)->int:
+        """
+        @param cell: Cell to start from.
+
+        @returns Number of moves from cell to the nearest exit, or -1 if no exit can be reached.  See exitField().
+        """
+        return self.exitField()[0][self.layout().coordIndex(cell)]
+
+
+
+    def exitRoute(self, cell: Coordinates3D)->List[Coordinates3D]:
+        """
+        Shortest route from a cell to the nearest exit, following the next hops of exitField(), so it takes time
+        proportional to the length of the route rather than a search.
+
+        @param cell: Cell to start from.
+
+        @returns Cells from cell to the nearest exit, both included, or an empty list if no exit can be reached.
+        """
+        (distances, nextHops) = self.exitField()
+        layout: GridLayout = self.layout()
+        index: int = layout.coordIndex(cell)
+        if distances[index] < 0:
+            return list()
+
+        route: List[Coordinates3D] = [cell]
+        index = nextHops[index]
+        while index >= 0:
+            route.append(layout.coordinates(index))
+            index = nextHops[index]
+
+        return route
+
+
+
     def hasCell(self, cell:Coordinates3D)->bool:
         """
         Checks if cell exists in maze.
@@ -354,6 +676,21 @@ class Maze3D:
 
 
 
+    def layout(self)->GridLayout:
+        """
+        @returns Flat index layout of the vertices of the maze, including the boundary, so solvers can keep per cell
+            information in arrays.  Shared with the graph if it is a grid graph.
+        """
+        if self.m_layout is None:
+            if isinstance(self.m_graph, GridWallGraph):
+                self.m_layout = self.m_graph.m_layout
+            else:
+                self.m_layout = GridLayout(self.m_levelDims)
+
+        return self.m_layout
+
+
+
     def checkCoordinates(self, coord:Coordinates3D)->bool:
         """
         Checks if the coordinates is a valid one.
@@ -399,4 +736,270 @@ class Maze3D:
 
 
 
-    
\ No newline at end of file
+    def setGenerationInfo(self, generatorName: str, randSeed: int):
+        """
+        Records how the maze was generated, so it can be stored along with the maze by save().
+
+        @param generatorName: Name of the generator approach used.
+        @param randSeed: Random seed used, or None if not seeded.
+        """
+        self.m_generatorName = generatorName
+        self.m_randSeed = randSeed
+
+
+
+    def getGeneratorName(self)->str:
+        """
+        @returns Name of the generator approach used to generate the maze, or None if unknown.
+        """
+        return self.m_generatorName
+
+
+
+    def getRandSeed(self)->int:
+        """
+        @returns Random seed used to generate the maze, or None if unknown.
+        """
+        return self.m_randSeed
+
+
+
+    def save(self, path: str):
+        """
+        Writes the maze to a binary file, which can be read back with load().  The file contents are those of
+        toBytes().
+
+        @param path: File to write to.
+        """
+        with open(path, 'wb') as mazeFile:
+            mazeFile.write(self.toBytes())
+
+
+
+    def toBytes(self)->bytes:
+        """
+        Serialises the maze, e.g., to store many mazes in one file.  Can be read back with fromBytes().
+        The data is a header (level dimensions, entrances, exits, generator name and seed) followed by the walls,
+        one 6-bit wall mask per vertex, laid out as in GridLayout.
+
+        @returns The serialised maze.
+        """
+
+        # the wall masks are the storage of an implicit GridWallGraph, so write that directly if we have one
+        walls = None
+        if isinstance(self.m_graph, GridWallGraph):
+            walls = self.m_graph.m_walls
+        else:
+            gridGraph: GridWallGraph = GridWallGraph(self.m_levelDims, implicit=True)
+            self._copyWalls(self.m_graph, gridGraph)
+            walls = gridGraph.m_walls
+
+        header: bytearray = bytearray(struct.pack('<4sHI', self.FILE_MAGIC, self.FILE_VERSION, len(self.m_levelDims)))
+        for (rowNum, colNum) in self.m_levelDims:
+            header += struct.pack('<ii', rowNum, colNum)
+        for cells in (self.m_entrance, self.m_exit):
+            header += struct.pack('<I', len(cells))
+            for cell in cells:
+                header += struct.pack('<iii', cell.getLevel(), cell.getRow(), cell.getCol())
+
+        genName: bytes = (self.m_generatorName or '').encode('utf-8')
+        header += struct.pack('<H', len(genName)) + genName
+        header += struct.pack('<?q', self.m_randSeed != None, self.m_randSeed if self.m_randSeed != None else 0)
+        header += struct.pack('<Q', len(walls))
+
+        return bytes(header + walls)
+
+
+
+    @staticmethod
+    def load(path: str, mmap: bool = True, graphType: str = 'implicit')->'Maze3D':
+        """
+        Reads a maze written by save().  The maze is ready to solve, i.e., it doesn't need to be generated.
+
+        @param path: File to read.
+        @param mmap: Whether to memory map the walls instead of reading them in.  Pages of the file are only read
+            when they are accessed, and changes to the maze are private and not written back to the file.
+            Only applies to the 'implicit' graph type.  Default is True.
+        @param graphType: Which graph implementation to store the maze in, one of GRAPH_TYPES.  'implicit' uses
+            the walls in the file as is, other types are built from them.  Default is 'implicit'.
+
+        @returns The loaded maze.
+        """
+        with open(path, 'rb') as mazeFile:
+            if mmap:
+                data = memoryview(mmapModule.mmap(mazeFile.fileno(), 0, access=mmapModule.ACCESS_COPY))
+            else:
+                data = memoryview(bytearray(mazeFile.read()))
+
+        return Maze3D._fromData(data, graphType, path)
+
+
+
+    @staticmethod
+    def fromBytes(data: bytes, graphType: str = 'implicit')->'Maze3D':
+        """
+        Reads a maze serialised by toBytes().  The maze is ready to solve, i.e., it doesn't need to be generated.
+
+        @param data: Serialised maze.
+        @param graphType: Which graph implementation to store the maze in, one of GRAPH_TYPES.  Default is 'implicit'.
+
+        @returns The deserialised maze.
+        """
+        return Maze3D._fromData(memoryview(bytearray(data)), graphType, 'Data')
+
+
+
+    @staticmethod
+    def _fromData(data: memoryview, graphType: str, source: str)->'Maze3D':
+        """
+        @param data: Writable view of a serialised maze.  An implicit maze uses its walls in place.
+        @param graphType: Which graph implementation to store the maze in, one of GRAPH_TYPES.
+        @param source: Where the data came from, for error messages.
+
+        @returns The deserialised maze.
+        """
+        (magic, version, levelNum) = struct.unpack_from('<4sHI', data, 0)
+        if magic != Maze3D.FILE_MAGIC or version != Maze3D.FILE_VERSION:
+            raise ValueError('{} is not a maze file of version {}.'.format(source, Maze3D.FILE_VERSION))
+        offset: int = struct.calcsize('<4sHI')
+
+        levelDims: List[Tuple[int, int]] = list()
+        for _ in range(levelNum):
+            levelDims.append(struct.unpack_from('<ii', data, offset))
+            offset += 8
+
+        cellLists: List[List[Coordinates3D]] = list()
+        for _ in range(2):
+            (cellNum,) = struct.unpack_from('<I', data, offset)
+            offset += 4
+            cells: List[Coordinates3D] = list()
+            for _ in range(cellNum):
+                cells.append(Coordinates3D(*struct.unpack_from('<iii', data, offset)))
+                offset += 12
+            cellLists.append(cells)
+
+        (nameLen,) = struct.unpack_from('<H', data, offset)
+        offset += 2
+        genName: str = bytes(data[offset:offset+nameLen]).decode('utf-8')
+        offset += nameLen
+        (hasSeed, randSeed, wallsLen) = struct.unpack_from('<?qQ', data, offset)
+        offset += struct.calcsize('<?qQ')
+
+        # implicit graph storing walls in the file data, without copying them
+        gridGraph: GridWallGraph = GridWallGraph(levelDims, implicit=True)
+        if wallsLen != gridGraph.m_layout.size() or offset + wallsLen > len(data):
+            raise ValueError('{} has walls that do not match its level dimensions.'.format(source))
+        gridGraph.m_walls = data[offset:offset+wallsLen]
+
+        maze: Maze3D = Maze3D(levelDims, graphType)
+        if graphType == 'implicit':
+            maze.m_graph = gridGraph
+        else:
+            maze.initCells(False)
+            maze._copyWalls(gridGraph, maze.m_graph)
+
+        maze.m_entrance = cellLists[0]
+        maze.m_exit = cellLists[1]
+        maze.setGenerationInfo(genName if nameLen > 0 else None, randSeed if hasSeed else None)
+
+        return maze
+
+
+
+    def snapshot(self)->'Maze3D':
+        """
+        Returns a read only copy of the maze in its current state, e.g., to hand to a solver that shouldn't be able to
+        change the maze.  This is cheap, as the walls are shared rather than copied.  Later changes to this maze
+        don't show up in the snapshot, and changing the snapshot's walls raises TypeError.
+
+        @returns Snapshot of the maze.
+        """
+        return self._derive(OverlayGraph(self._freezeGraph(), readOnly=True))
+
+
+
+    def fork(self)->'Maze3D':
+        """
+        Returns a copy of the maze that can be changed independently of this one.  The walls are shared copy-on-write,
+        so the fork only stores the walls that are changed in it (see OverlayGraph).
+
+        @returns Fork of the maze.
+        """
+        return self._derive(OverlayGraph(self._freezeGraph()))
+
+
+
+    def _freezeGraph(self)->Graph:
+        """
+        Makes the current graph a shared base that is no longer modified, by moving this maze's later changes into an
+        overlay over it.  The maze is never more than one overlay deep: if it has changed since it was last frozen,
+        its changes are copied into a new base (see _flattenGraph()), rather than stacking another overlay.
+
+        @returns The frozen graph.
+        """
+        graph: Graph = self.m_graph
+        if isinstance(graph, OverlayGraph):
+            # no changes since last frozen (snapshots never have any), can share the same base again
+            if not graph.hasChanges():
+                return graph.m_base
+            graph = self._flattenGraph(graph)
+
+        self.m_graph = OverlayGraph(graph)
+
+        return graph
+
+
+
+    def _flattenGraph(self, overlay: OverlayGraph)->Graph:
+        """
+        @param overlay: Overlay graph of this maze.
+
+        @returns New graph, of the same type as the overlay's base, with the walls of the overlay.
+        """
+        base: Graph = overlay.m_base
+        if isinstance(base, GridWallGraph):
+            # the wall masks are a single array, copying them is much faster than copying wall by wall
+            flat: Graph = copy.copy(base)
+            flat.m_walls = bytearray(base.m_walls)
+            if base.m_links is not None:
+                flat.m_links = bytearray(base.m_links)
+        else:
+            flat = copy.deepcopy(base)
+
+        added: List[Tuple[Coordinates3D, Coordinates3D]] = list()
+        removed: List[Tuple[Coordinates3D, Coordinates3D]] = list()
+        for (vert1, vert2, wallStatus) in overlay.changedWalls():
+            (added if wallStatus else removed).append((vert1, vert2))
+        flat.updateWalls(added, True)
+        flat.updateWalls(removed, False)
+
+        return flat
+
+
+
+    def _derive(self, graph: Graph)->'Maze3D':
+        """
+        @param graph: Graph of the derived maze.
+
+        @returns Copy of this maze with graph as its graph, and its own entrance and exit lists.
+        """
+        derived: Maze3D = copy.copy(self)
+        derived.m_graph = graph
+        derived.m_entrance = list(self.m_entrance)
+        derived.m_exit = list(self.m_exit)
+        derived.m_passableCache = {}
+
+        return derived
+
+
+
+    def _copyWalls(self, source: Graph, target: Graph):
+        """
+        Adds the walls of source graph to target graph, which should have the same cells and neighbourhoods.
+
+        @param source: Graph to copy walls from.
+        @param target: Graph to copy walls to.
+        """
+        for cell in source.vertices():
+            for (_, neigh) in source.neighbourWalls(cell):
+                target.updateWall(cell, neigh, True)
@@ -0,0 +1,129 @@
+# -------------------------------------------------
+# On-disk cache of generated mazes.
+#
+# __copyright__ = 'Copyright 2024, RMIT University'
+# -------------------------------------------------
+
+
+import hashlib
+import json
+import os
+from typing import List
+
+from maze.maze3D import Maze3D
+
+
+class MazeCache:
+    """
+    Cache of generated mazes, stored as maze files (see Maze3D.save()) in a directory.
+    Entries are addressed by a hash of everything that determines the generated maze, i.e., the level
+    specifications, entrances, exits, generator and random seed.  When the total size of the cached files goes over
+    the size cap, the least recently used entries are removed.
+    """
+
+    # extension of cached maze files
+    FILE_EXTENSION = '.mz'
+
+    # version of how generated mazes follow from their parameters, part of every key.  Increase it when generators
+    # draw random numbers differently, so mazes cached before are not mistaken for the new ones.
+    KEY_VERSION = 3
+
+
+
+    def __init__(self, cacheDir: str, maxBytes: int = 1 << 30):
+        """
+        Constructor.
+
+        @param cacheDir: Directory to store the cached mazes in.  Created if it doesn't exist.
+        @param maxBytes: Maximum total size of the cached mazes, in bytes.  Default is 1GB.
+        """
+        self.m_cacheDir: str = cacheDir
+        self.m_maxBytes: int = maxBytes
+
+        os.makedirs(cacheDir, exist_ok=True)
+
+
+
+    def key(self, levelSpecs: List[List[int]], entrances: List[List[int]], exits: List[List[int]],
+            generatorName: str, randSeed: int)->str:
+        """
+        @param levelSpecs: Specifications of each level, as in the configuration file.
+        @param entrances: Entrances, as in the configuration file.
+        @param exits: Exits, as in the configuration file.
+        @param generatorName: Name of the generator approach.
+        @param randSeed: Random seed used for generation.
+
+        @returns Key of the maze generated with these parameters.
+        """
+        spec: str = json.dumps([self.KEY_VERSION, [list(dims) for dims in levelSpecs], [list(ent) for ent in entrances],
+                                [list(ext) for ext in exits], generatorName, randSeed])
+
+        return hashlib.sha256(spec.encode('utf-8')).hexdigest()
+
+
+
+    def load(self, key: str, graphType: str = 'implicit')->Maze3D:
+        """
+        Loads a cached maze, and marks it as recently used.
+
+        @param key: Key of the maze, see key().
+        @param graphType: Which graph implementation to store the maze in, see Maze3D.load().  Default is 'implicit'.
+
+        @returns The cached maze, or None if it isn't in the cache.
+        """
+        path: str = self._path(key)
+        if not os.path.exists(path):
+            return None
+
+        maze: Maze3D = Maze3D.load(path, graphType=graphType)
+
+        # modification time tracks when an entry was last used
+        os.utime(path)
+
+        return maze
+
+
+
+    def store(self, key: str, maze: Maze3D):
+        """
+        Adds a maze to the cache, removing least recently used entries if the cache is over its size cap.
+
+        @param key: Key of the maze, see key().
+        @param maze: Maze to store.
+        """
+        path: str = self._path(key)
+
+        # write to a temporary file first, so a partially written maze is never picked up
+        tempPath: str = '{}.{}.tmp'.format(path, os.getpid())
+        maze.save(tempPath)
+        os.replace(tempPath, path)
+
+        self._evict()
+
+
+
+    def _path(self, key: str)->str:
+        """
+        @param key: Key of the maze.
+
+        @returns Path of the cached file for key.
+        """
+        return os.path.join(self.m_cacheDir, key + self.FILE_EXTENSION)
+
+
+
+    def _evict(self):
+        """
+        Removes least recently used entries until the cache is within its size cap.
+        """
+        entries: List[os.DirEntry] = [entry for entry in os.scandir(self.m_cacheDir)
+                                      if entry.is_file() and entry.name.endswith(self.FILE_EXTENSION)]
+        totalBytes: int = sum([entry.stat().st_size for entry in entries])
+
+        # oldest first
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries:
+            if totalBytes <= self.m_maxBytes:
+                break
+            totalBytes -= entry.stat().st_size
+            os.remove(entry.path)
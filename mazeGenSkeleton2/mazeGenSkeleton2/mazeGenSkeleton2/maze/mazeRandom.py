@@ -0,0 +1,84 @@
+# -------------------------------------------------
+# Seeded, splittable random streams for generators and solvers.
+#
+# __copyright__ = 'Copyright 2024, RMIT University'
+# -------------------------------------------------
+
+
+import hashlib
+import random
+from typing import Tuple, Union
+
+# NumPy is optional, only needed for numpyGenerator().
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class MazeRandom(random.Random):
+    """
+    Random stream of a single generator or solver, so that several of them can run in one process, interleaved or
+    in parallel, without affecting each other's draws.
+
+    A stream is identified by a root seed and a path of stream ids, e.g., (seed, ('generator', 3)).  Its state is
+    derived from a hash of that identity, rather than from draws of another stream, so any substream can be created
+    directly with split(), in any order and in any process, and always produces the same draws.  This is what
+    counter-based generators do, and numpyGenerator() provides an actual counter-based one (Philox) keyed by the
+    same identity, for vectorised batch draws.
+
+    As a subclass of random.Random, it provides all the usual methods, e.g., randint(), choice() and shuffle().
+    """
+
+    def __init__(self, seed: int = None, streamPath: Tuple[Union[int, str], ...] = ()):
+        """
+        Constructor.
+
+        @param seed: Root seed.  Default is None, draw one from the global random module, so the stream follows
+            random.seed().
+        @param streamPath: Stream ids identifying this stream under the root seed.  Default is the root stream.
+        """
+        if seed is None:
+            seed = random.getrandbits(64)
+
+        self.m_seed: int = seed
+        self.m_streamPath: Tuple[Union[int, str], ...] = tuple(streamPath)
+
+        super().__init__(self.streamKey())
+
+
+
+    def split(self, streamId: Union[int, str])->'MazeRandom':
+        """
+        @param streamId: Id of the substream, e.g., a worker, tile or level number.
+
+        @returns Independent substream of this stream.  Does not draw from, or otherwise change, this stream.
+        """
+        return MazeRandom(self.m_seed, self.m_streamPath + (streamId,))
+
+
+
+    def streamKey(self)->int:
+        """
+        @returns 128-bit key identifying this stream, derived from the root seed and stream path.
+        """
+        identity: bytes = repr((self.m_seed,) + self.m_streamPath).encode('utf-8')
+        return int.from_bytes(hashlib.blake2b(identity, digest_size=16).digest(), 'little')
+
+
+
+    def numpyGenerator(self):
+        """
+        @returns NumPy Generator using the counter-based Philox bit generator keyed by this stream, for vectorised
+            batch draws.  Its draws are independent of those of this stream.
+        """
+        if np is None:
+            raise ImportError('NumPy not available on this computer.')
+
+        return np.random.Generator(np.random.Philox(key=self.streamKey()))
+
+
+
+    def __reduce__(self):
+        # keep the stream identity when pickled, e.g., when passed to a worker process
+        return (self.__class__, (self.m_seed, self.m_streamPath), self.getstate())
@@ -0,0 +1,234 @@
+# -------------------------------------------------
+# Path query index for perfect mazes.
+#
+# __copyright__ = 'Copyright 2024, RMIT University'
+# -------------------------------------------------
+
+
+from array import array
+from typing import List, Optional, Tuple
+
+from maze.util import Coordinates3D
+from maze.gridLayout import GridLayout
+from maze.maze3D import Maze3D
+
+
+class MazeTreeIndex:
+    """
+    Index answering distance and path queries between any two cells of a perfect maze, i.e., one whose passages
+    form a spanning tree, as all the generators produce.  There is then exactly one path between any two cells, which
+    goes through their lowest common ancestor in the tree.
+
+    The tree is rooted at cell (0, 0, 0) and its nodes are numbered in breadth first order, so every node comes after
+    its parent.  Depths and ancestors are kept in compact arrays indexed by node number, with binary lifting: the
+    2^k-th ancestor of every node for each k, so the common ancestor of two cells is found in O(log n).  distance() is
+    then O(log n) and path() is O(log n + path length), without any search.
+
+    Carved entrances and exits are part of the tree, as leaves.  The index is built from the walls the maze has at
+    the time, and does not follow later changes.
+    """
+
+    def __init__(self, maze: Maze3D):
+        """
+        Constructor.  Builds the index.
+
+        @param maze: Maze to index.
+
+        @raises ValueError: If the passages of the maze do not form a spanning tree of its cells, i.e., there is a
+            loop or some cells can't be reached.
+        """
+        layout: GridLayout = maze.layout()
+        self.m_layout: GridLayout = layout
+
+        # self.m_nodes: node number of each vertex, indexed as layout(), -1 for vertices not in the tree.
+        self.m_nodes: array = array('i', [-1]) * layout.size()
+        # self.m_indices: layout index of each node.
+        self.m_indices: array = array('i')
+        # self.m_depths: number of moves from the root to each node.
+        self.m_depths: array = array('i')
+        # self.m_ancestors: m_ancestors[k][node] is the 2^k-th ancestor of node, or the root if it is closer than that.
+        self.m_ancestors: List[array] = list()
+
+        parents: array = array('i')
+        root: Coordinates3D = Coordinates3D(0, 0, 0)
+        self.addNode(layout.coordIndex(root), 0, 0, parents)
+
+        # breadth first over the passages, a passage back to a node other than the parent means a loop
+        node: int = 0
+        while node < len(self.m_indices):
+            cell: Coordinates3D = layout.coordinates(self.m_indices[node])
+            parentIndex: int = self.m_indices[parents[node]] if node > 0 else -1
+            for neigh in maze.m_graph.openNeighbours(cell):
+                neighIndex: int = layout.coordIndex(neigh)
+                if neighIndex == parentIndex:
+                    continue
+                if self.m_nodes[neighIndex] >= 0:
+                    raise ValueError('Maze is not a tree, there is a loop through {} and {}.'.format(cell, neigh))
+                self.addNode(neighIndex, node, self.m_depths[node] + 1, parents)
+            node += 1
+
+        cellNum: int = sum([rowNum * colNum for (rowNum, colNum) in maze.m_levelDims])
+        reachedNum: int = 0
+        for index in self.m_indices:
+            vertex: Coordinates3D = layout.coordinates(index)
+            (rowNum, colNum) = maze.m_levelDims[vertex.getLevel()]
+            if 0 <= vertex.getRow() < rowNum and 0 <= vertex.getCol() < colNum:
+                reachedNum += 1
+        if reachedNum < cellNum:
+            raise ValueError('Maze is not a tree, {} of {} cells can not be reached from {}.'.format(
+                cellNum - reachedNum, cellNum, root))
+
+        # nodes come after their parents, so every ancestor array can be built from the previous one in one pass
+        self.m_ancestors.append(parents)
+        maxDepth: int = max(self.m_depths)
+        while (1 << len(self.m_ancestors)) <= maxDepth:
+            previous: array = self.m_ancestors[-1]
+            self.m_ancestors.append(array('i', [previous[ancestor] for ancestor in previous]))
+
+
+
+    def addNode(self, index: int, parent: int, depth: int, parents: array):
+        """
+        Adds a vertex to the tree, numbered after all nodes added so far.
+
+        @param index: Layout index of the vertex.
+        @param parent: Node number of its parent, the root is its own parent.
+        @param depth: Depth of the vertex.
+        @param parents: Parent of each node, to add to.
+        """
+        self.m_nodes[index] = len(self.m_indices)
+        self.m_indices.append(index)
+        self.m_depths.append(depth)
+        parents.append(parent)
+
+
+
+    def node(self, cell: Coordinates3D)->int:
+        """
+        @param cell: Cell or boundary vertex of the maze.
+
+        @returns Node number of cell, or -1 if it is not in the tree, e.g., an uncarved boundary vertex.
+        """
+        index: int = self.m_layout.coordIndex(cell)
+
+        return self.m_nodes[index] if index >= 0 else -1
+
+
+
+    def ancestor(self, node: int, steps: int)->int:
+        """
+        @param node: Node number.
+        @param steps: Number of moves towards the root, at most the depth of node.
+
+        @returns Node number of the ancestor that many moves up from node.
+        """
+        k: int = 0
+        while steps > 0:
+            if steps & 1:
+                node = self.m_ancestors[k][node]
+            steps >>= 1
+            k += 1
+
+        return node
+
+
+
+    def commonAncestor(self, node1: int, node2: int)->int:
+        """
+        @param node1: Node number.
+        @param node2: Node number.
+
+        @returns Node number of the lowest common ancestor of node1 and node2.
+        """
+        depths: array = self.m_depths
+        if depths[node1] < depths[node2]:
+            (node1, node2) = (node2, node1)
+        node1 = self.ancestor(node1, depths[node1] - depths[node2])
+        if node1 == node2:
+            return node1
+
+        # jump both up by the largest steps that keep them apart, they then have the same parent
+        for k in range(len(self.m_ancestors) - 1, -1, -1):
+            ancestors: array = self.m_ancestors[k]
+            if ancestors[node1] != ancestors[node2]:
+                node1 = ancestors[node1]
+                node2 = ancestors[node2]
+
+        return self.m_ancestors[0][node1]
+
+
+
+    def distance(self, cell1: Coordinates3D, cell2: Coordinates3D)->int:
+        """
+        @param cell1: Cell or boundary vertex of the maze.
+        @param cell2: Cell or boundary vertex of the maze.
+
+        @returns Number of moves on the path between cell1 and cell2, or -1 if either is not in the tree.
+        """
+        (node1, node2) = (self.node(cell1), self.node(cell2))
+        if node1 < 0 or node2 < 0:
+            return -1
+
+        depths: array = self.m_depths
+        return depths[node1] + depths[node2] - 2 * depths[self.commonAncestor(node1, node2)]
+
+
+
+    def path(self, cell1: Coordinates3D, cell2: Coordinates3D)->List[Coordinates3D]:
+        """
+        @param cell1: Cell or boundary vertex of the maze.
+        @param cell2: Cell or boundary vertex of the maze.
+
+        @returns Cells of the path from cell1 to cell2, both included, or an empty list if either is not in the tree.
+        """
+        (node1, node2) = (self.node(cell1), self.node(cell2))
+        if node1 < 0 or node2 < 0:
+            return list()
+
+        common: int = self.commonAncestor(node1, node2)
+        parents: array = self.m_ancestors[0]
+
+        # up from cell1 to the common ancestor, then down to cell2, by going up from cell2 and reversing
+        upward: List[int] = [node1]
+        while upward[-1] != common:
+            upward.append(parents[upward[-1]])
+        downward: List[int] = [node2]
+        while downward[-1] != common:
+            downward.append(parents[downward[-1]])
+        downward.pop()
+        downward.reverse()
+
+        return [self.m_layout.coordinates(self.m_indices[node]) for node in upward + downward]
+
+
+
+    def distanceTable(self, sources: List[Coordinates3D], targets: List[Coordinates3D])->List[List[Optional[int]]]:
+        """
+        Distances between many cells at once, e.g., all entrances and exits.
+
+        @param sources: Cells or boundary vertices of the maze.
+        @param targets: Cells or boundary vertices of the maze.
+
+        @returns table[i][j] is the distance from sources[i] to targets[j], or None if either is not in the tree.
+        """
+        return [[dist if dist >= 0 else None for dist in [self.distance(source, target) for target in targets]]
+                for source in sources]
+
+
+
+    def closestPair(self, sources: List[Coordinates3D], targets: List[Coordinates3D])->Tuple[Coordinates3D, Coordinates3D, int]:
+        """
+        Task C style pair selection, e.g., the entrance and exit with the shortest path between them.
+
+        @param sources: Cells or boundary vertices of the maze.
+        @param targets: Cells or boundary vertices of the maze.
+
+        @returns (source, target, distance) of the closest pair, or (None, None, -1) if no pair is in the tree.
+        """
+        best: Tuple[Coordinates3D, Coordinates3D, int] = (None, None, -1)
+        for (source, row) in zip(sources, self.distanceTable(sources, targets)):
+            for (target, dist) in zip(targets, row):
+                if dist is not None and (best[2] < 0 or dist < best[2]):
+                    best = (source, target, dist)
+
+        return best
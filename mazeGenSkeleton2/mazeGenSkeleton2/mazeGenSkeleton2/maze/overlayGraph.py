@@ -0,0 +1,213 @@
+# ------------------------------------------------------------------------
+# Copy-on-write graph, storing wall changes over a shared base graph.
+#
+# __copyright__ = 'Copyright 2024, RMIT University'
+# ------------------------------------------------------------------------
+
+
+from typing import Iterable, List, Tuple
+
+from maze.util import Coordinates3D, WallCoordinates
+from maze.graph import Graph
+
+
+class OverlayGraph(Graph):
+    """
+    Represents an undirected graph as a set of wall changes (the delta) over a base graph.  The base graph is
+    shared and never modified, so many overlays can be layered over one large graph, each only paying for the
+    walls it changes.
+
+    The vertices and edges are those of the base graph, only wall status can be changed.  A read only overlay
+    cannot change walls either, and raises TypeError if asked to.
+    """
+
+    def __init__(self, base: Graph, readOnly: bool = False):
+        """
+        Constructor.
+
+        @param base: Graph to layer the changes over.  It should not be modified while the overlay is in use.
+        @param readOnly: Whether wall changes are disallowed.  Default is False.
+        """
+
+        self.m_base: Graph = base
+        self.m_readOnly: bool = readOnly
+
+        # self.m_delta: wall key (see wallKey()) -> wall status, for the walls whose status differs from base.
+        self.m_delta: dict[int, bool] = {}
+
+
+
+    def hasChanges(self)->bool:
+        """
+        @returns True if any wall differs from the base graph.
+        """
+        return len(self.m_delta) > 0
+
+
+
+    def changedWalls(self)->List[Tuple[Coordinates3D, Coordinates3D, bool]]:
+        """
+        @returns (vert1, vert2, wall status) of every wall that differs from the base graph.
+        """
+        keyMask: int = (1 << WallCoordinates.KEY_SHIFT) - 1
+
+        return [(Coordinates3D.fromKey(key >> WallCoordinates.KEY_SHIFT), Coordinates3D.fromKey(key & keyMask), status)
+                for (key, status) in self.m_delta.items()]
+
+
+
+    def isReadOnly(self)->bool:
+        """
+        @returns True if walls cannot be changed.
+        """
+        return self.m_readOnly
+
+
+
+    def addVertex(self, label:Coordinates3D):
+
+        self.checkWritable()
+
+
+
+    def addVertices(self, vertLabels:List[Coordinates3D]):
+
+        self.checkWritable()
+
+
+
+    def addEdge(self, vert1:Coordinates3D, vert2:Coordinates3D, addWall:bool = False)->bool:
+
+        # the edges are those of the base graph
+        self.checkWritable()
+        return False
+
+
+
+    def updateWall(self, vert1:Coordinates3D, vert2:Coordinates3D, wallStatus:bool)->bool:
+
+        self.checkWritable()
+        if not self.m_base.hasEdge(vert1, vert2):
+            return False
+
+        # only store walls that differ from the base, so the delta doesn't grow when changes are undone
+        key: int = self.wallKey(vert1, vert2)
+        if self.m_base.getWallStatus(vert1, vert2) == wallStatus:
+            self.m_delta.pop(key, None)
+        else:
+            self.m_delta[key] = wallStatus
+
+        return True
+
+
+
+    def updateWalls(self, pairs:Iterable[Tuple[Coordinates3D, Coordinates3D]], wallStatus:bool)->int:
+
+        self.checkWritable()
+        pairs = [(vert1, vert2) for (vert1, vert2) in pairs if self.m_base.hasEdge(vert1, vert2)]
+        for ((vert1, vert2), baseStatus) in zip(pairs, self.m_base.getWallStatuses(pairs)):
+            key: int = self.wallKey(vert1, vert2)
+            if baseStatus == wallStatus:
+                self.m_delta.pop(key, None)
+            else:
+                self.m_delta[key] = wallStatus
+
+        return len(pairs)
+
+
+
+    def removeEdge(self, vert1:Coordinates3D, vert2:Coordinates3D)->bool:
+
+        # the edges are those of the base graph
+        self.checkWritable()
+        return False
+
+
+
+    def hasVertex(self, label:Coordinates3D)->bool:
+        return self.m_base.hasVertex(label)
+
+
+
+    def hasEdge(self, vert1:Coordinates3D, vert2:Coordinates3D)->bool:
+        return self.m_base.hasEdge(vert1, vert2)
+
+
+
+    def getWallStatus(self, vert1:Coordinates3D, vert2:Coordinates3D)->bool:
+
+        # only existing edges are stored in the delta
+        status: bool = self.m_delta.get(self.wallKey(vert1, vert2)) if self.m_delta else None
+        if status is None:
+            return self.m_base.getWallStatus(vert1, vert2)
+
+        return status
+
+
+
+    def getWallStatuses(self, pairs:Iterable[Tuple[Coordinates3D, Coordinates3D]])->List[bool]:
+
+        pairs = list(pairs)
+        statuses: List[bool] = self.m_base.getWallStatuses(pairs)
+        if self.m_delta:
+            for (i, (vert1, vert2)) in enumerate(pairs):
+                status: bool = self.m_delta.get(self.wallKey(vert1, vert2))
+                if status is not None:
+                    statuses[i] = status
+
+        return statuses
+
+
+
+    def neighbours(self, label:Coordinates3D)->List[Coordinates3D]:
+        return self.m_base.neighbours(label)
+
+
+
+    def openNeighbours(self, label:Coordinates3D)->List[Coordinates3D]:
+
+        if not self.m_delta:
+            return self.m_base.openNeighbours(label)
+
+        return super().openNeighbours(label)
+
+
+
+    def neighbourWalls(self, label:Coordinates3D)->List[WallCoordinates]:
+
+        if not self.m_delta:
+            return self.m_base.neighbourWalls(label)
+
+        neighbours: List[Coordinates3D] = self.m_base.neighbours(label)
+        return [(label, neigh) for (neigh, hasWall) in
+                zip(neighbours, self.getWallStatuses([(label, neigh) for neigh in neighbours])) if hasWall]
+
+
+
+    def vertices(self)->List[Coordinates3D]:
+        return self.m_base.vertices()
+
+
+
+    def wallKey(self, vert1:Coordinates3D, vert2:Coordinates3D)->int:
+        """
+        @param vert1: One side of the wall.
+        @param vert2: Other side of the wall.
+
+        @returns Integer key of the wall between vert1 and vert2, same as WallCoordinates.getKey().
+        """
+        key1: int = vert1.getKey()
+        key2: int = vert2.getKey()
+        if key1 < key2:
+            return (key1 << WallCoordinates.KEY_SHIFT) | key2
+        else:
+            return (key2 << WallCoordinates.KEY_SHIFT) | key1
+
+
+
+    def checkWritable(self):
+        """
+        Raises TypeError if the overlay is read only.
+        """
+        if self.m_readOnly:
+            raise TypeError('Maze is a read only snapshot and cannot be modified.')
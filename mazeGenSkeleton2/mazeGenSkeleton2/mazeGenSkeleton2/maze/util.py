@@ -26,18 +26,74 @@ class Coordinates3D:
     """
     Represent 3D coordinates for maze cells.
     Note this is not exactly the same as Coordinate from Assignment 1.
+
+    Level, row and column are also packed into a single integer key, which is used for hashing, equality and
+    ordering.  Each of them must lie in [-KEY_OFFSET, KEY_OFFSET), which the constructor does not check, as
+    coordinates are constructed very often; packKey() does.
+    Coordinates should not be modified after construction.
     """
 
+    __slots__ = ('m_level', 'm_r', 'm_c', 'm_key')
+
+    # Number of bits each of level, row and column occupies in the packed key, and the offset added to them so
+    # negative values (boundary cells, direction offsets) pack as non-negative numbers.
+    KEY_BITS: int = 21
+    KEY_OFFSET: int = 1 << (KEY_BITS - 1)
+    KEY_MASK: int = (1 << KEY_BITS) - 1
+
+
+
     def __init__(self, level: int, row:int, col:int):
         """
         Constructor.
         
+        @param level: Level of coordinates.
         @param row: Row of coordinates.
         @param col: Column of coordinates.
         """
         self.m_level: int = level
         self.m_r: int = row
         self.m_c: int = col
+        # same as packKey() without the range check, inlined as coordinates are constructed very often
+        offset: int = Coordinates3D.KEY_OFFSET
+        bits: int = Coordinates3D.KEY_BITS
+        self.m_key: int = ((level + offset) << (bits + bits)) | ((row + offset) << bits) | (col + offset)
+
+
+
+    @staticmethod
+    def packKey(level: int, row: int, col: int)->int:
+        """
+        Packs level, row and column into one integer.  Keys order the same way as the coordinates do.
+
+        @param level: Level of coordinates.
+        @param row: Row of coordinates.
+        @param col: Column of coordinates.
+
+        @returns Packed key.
+
+        @raises ValueError: If level, row or column is outside [-KEY_OFFSET, KEY_OFFSET).
+        """
+        offset: int = Coordinates3D.KEY_OFFSET
+        if not (-offset <= level < offset and -offset <= row < offset and -offset <= col < offset):
+            raise ValueError('Coordinates ({}, {}, {}) can not be packed into a key.'.format(level, row, col))
+
+        bits: int = Coordinates3D.KEY_BITS
+        return ((level + offset) << (bits + bits)) | ((row + offset) << bits) | (col + offset)
+
+
+
+    @classmethod
+    def fromKey(cls, key: int)->Coordinates3D:
+        """
+        @param key: Key as returned by packKey() or getKey().
+
+        @returns Coordinates with that key.
+        """
+        return cls((key >> (2 * cls.KEY_BITS)) - cls.KEY_OFFSET,
+                   ((key >> cls.KEY_BITS) & cls.KEY_MASK) - cls.KEY_OFFSET,
+                   (key & cls.KEY_MASK) - cls.KEY_OFFSET)
+
 
 
     def getRow(self)->int:
@@ -64,14 +120,22 @@ class Coordinates3D:
     
 
 
+    def getKey(self)->int:
+        """
+        @returns Packed integer key of coordinate.
+        """
+        return self.m_key
+
+
+
     def __eq__(self, other: Coordinates3D):
         """
         Define == operator.
 
         @param other: Other coordinates that we are comparing with.
         """
-        if other != None:
-            return self.m_level == other.getLevel() and self.m_r == other.getRow() and self.m_c == other.getCol()
+        if isinstance(other, Coordinates3D):
+            return self.m_key == other.m_key
         else:
             return False
         
@@ -85,9 +149,8 @@ class Coordinates3D:
         """
 
         if other != None:
-            return (self.m_level < other.getLevel()) or \
-                (self.m_level == other.getLevel() and self.m_r < other.getRow()) or \
-                    (self.m_level == other.getLevel() and self.m_r == other.getRow() and self.m_c < other.getCol())
+            # packed keys are ordered by level, then row, then column
+            return self.m_key < other.m_key
         else:
             return False
 
@@ -108,7 +171,7 @@ class Coordinates3D:
         """
         Returns has value of Coordinates.  Needed for being a key in dictionaries.
         """
-        return hash(str(self.m_level) + '|' + str(self.m_r)+'|'+str(self.m_c))
+        return self.m_key
     
 
 
@@ -135,8 +198,16 @@ class WallCoordinates:
 class WallCoordinates:
     """
     Represent a wall coordinate essentially a pair of coordinates that uniquely identifies a wall.
+    The keys of the two coordinates are combined into an integer wall key, used for hashing and equality.
     """
 
+    __slots__ = ('m_coord1st', 'm_coord2nd', 'm_key')
+
+    # Number of bits the key of the first coordinates is shifted by, coordinate keys are 3 * KEY_BITS bits long.
+    KEY_SHIFT: int = 3 * Coordinates3D.KEY_BITS
+
+
+
     def __init__(self, coord1: Coordinates3D, coord2: Coordinates3D):
         """
         Constructor.  We store the smaller coord as m_coord1st, and other as m_coord2nd.
@@ -152,6 +223,8 @@ class WallCoordinates:
             self.m_coord1st = coord2
             self.m_coord2nd = coord1
 
+        self.m_key: int = (self.m_coord1st.getKey() << WallCoordinates.KEY_SHIFT) | self.m_coord2nd.getKey()
+
     
 
     def getFirst(self)->Coordinates3D:
@@ -170,15 +243,23 @@ class WallCoordinates:
 
 
 
+    def getKey(self)->int:
+        """
+        @return Integer key of the wall, unique to the pair of coordinates.
+        """
+        return self.m_key
+
+
+
     def __eq__(self, other: WallCoordinates):
         """
         Define == operator.
 
         @param other: Other coordinates that we are comparing with.
         """
-        if other != None:
+        if isinstance(other, WallCoordinates):
             # we don't need to test for reverse, as WallCoordinates always have the first coordinate as the smaller coordinates.
-            return (self.m_coord1st == other.getFirst() and self.m_coord2nd == other.getSecond()) 
+            return self.m_key == other.m_key
         else:
             return False
 
@@ -188,4 +269,4 @@ class WallCoordinates:
         """
         @return: Returns hash value of WallCoordinates.  Needed for being a key in dictionaries.
         """
-        return hash(str(self.m_coord1st)+'-'+str(self.m_coord2nd))
\ No newline at end of file
+        return hash(self.m_key)
@@ -0,0 +1,212 @@
+# -------------------------------------------------------------------
+# Entry point to generate a corpus of many mazes in one run.
+# Refer to usage() for exact format of input expected to the program.
+#
+# __copyright__ = 'Copyright 2024, RMIT University'
+# -------------------------------------------------------------------
+
+
+import sys
+import os
+import time
+import json
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
+
+from generatorSelector import GeneratorSelector
+from generation.mazeGenerator import MazeGenerator
+
+from maze.maze3D import Maze3D
+from maze.mazeRandom import MazeRandom
+
+
+# file names of a shard's mazes and index, by shard number, and of the index of the whole corpus.
+SHARD_FILE = 'shard-{:05d}.mzs'
+SHARD_INDEX_FILE = 'shard-{:05d}.json'
+CORPUS_INDEX_FILE = 'index.json'
+
+
+
+def usage():
+	"""
+	Print help/usage message.
+	"""
+
+	# On Teaching servers, use 'python3'
+	# On Windows, you may need to use 'python' instead of 'python3' to get this to work
+	print('python3 mazeBatch.py', '<batch configuration file>')
+	print('The configuration is a json object with keys:')
+	print('    "levelSpecs": list of level specifications, each as in the configuration of mazeTester2.py.')
+	print('    "generators": list of generator names.')
+	print('    "seeds": [first, last + 1], range of random seeds to generate each specification and generator with.')
+	print('    "outputDir": directory to write the shards to.')
+	print('    "shardSize": (optional) number of mazes per shard.  Default is 1000.')
+	print('    "workers": (optional) number of worker processes.  Default is one per CPU.')
+	sys.exit(1)
+
+
+
+def generateShard(shardNum: int, jobs: List[Tuple[int, List[List[int]], str, int]], outputDir: str)->Tuple[int, int, float, int]:
+	"""
+	Generates the mazes of one shard, and writes them to the shard file, followed by the shard's index.  Runs in a
+	worker process.
+
+	Each maze is serialised with Maze3D.toBytes() and compressed on its own with zlib, so any maze can be read back
+	from its offset and length alone, see readMaze().  The index is written last, so a shard with an index is
+	complete.
+
+	@param shardNum: Number of the shard.
+	@param jobs: (level specification number, level specification, generator name, random seed) of each maze.
+	@param outputDir: Directory to write the shard to.
+
+	@returns (shard number, number of mazes, seconds spent generating and writing, process id).
+	"""
+	startTime: float = time.perf_counter()
+	genSelector: GeneratorSelector = GeneratorSelector()
+
+	entries: List[dict] = list()
+	shardPath: str = os.path.join(outputDir, SHARD_FILE.format(shardNum))
+	with open(shardPath + '.tmp', 'wb') as shardFile:
+		offset: int = 0
+		for (specNum, levelSpec, genApproach, randSeed) in jobs:
+			maze: Maze3D = Maze3D([tuple(dims) for dims in levelSpec], 'implicit')
+			generator: MazeGenerator = genSelector.construct(genApproach)
+			# same stream as mazeTester2.py, so a maze can be reproduced there from its seed
+			generator.setRandom(MazeRandom(randSeed, ('generator',)))
+			generator.generateMaze(maze)
+			maze.setGenerationInfo(genApproach, randSeed)
+
+			data: bytes = zlib.compress(maze.toBytes())
+			shardFile.write(data)
+			entries.append({'spec': specNum, 'generator': genApproach, 'seed': randSeed, 'offset': offset,
+							'length': len(data)})
+			offset += len(data)
+
+	os.replace(shardPath + '.tmp', shardPath)
+	writeJson(os.path.join(outputDir, SHARD_INDEX_FILE.format(shardNum)), entries)
+
+	return (shardNum, len(jobs), time.perf_counter() - startTime, os.getpid())
+
+
+
+def readMaze(shardPath: str, offset: int, length: int, graphType: str = 'implicit')->Maze3D:
+	"""
+	Reads a single maze of a shard.
+
+	@param shardPath: Shard file.
+	@param offset: Byte offset of the maze in the shard, from the index.
+	@param length: Byte length of the maze in the shard, from the index.
+	@param graphType: Which graph implementation to store the maze in, see Maze3D.load().  Default is 'implicit'.
+
+	@returns The maze.
+	"""
+	with open(shardPath, 'rb') as shardFile:
+		shardFile.seek(offset)
+		return Maze3D.fromBytes(zlib.decompress(shardFile.read(length)), graphType)
+
+
+
+def readJson(path: str):
+	"""
+	@param path: File to read.
+
+	@returns Object read from the json file.
+	"""
+	with open(path, 'r') as jsonFile:
+		return json.load(jsonFile)
+
+
+
+def writeJson(path: str, content):
+	"""
+	Writes json to a temporary file first, so a partially written file is never picked up.
+
+	@param path: File to write.
+	@param content: Object to write as json.
+	"""
+	with open(path + '.tmp', 'w') as jsonFile:
+		json.dump(content, jsonFile)
+	os.replace(path + '.tmp', path)
+
+
+
+#
+# Main function, when the python script is executed, we execute this.
+#
+if __name__ == '__main__':
+	# Fetch the command line arguments
+	args = sys.argv
+
+	if len(args) != 2:
+		print('Incorrect number of arguments.')
+		usage()
+
+
+	# open configuration file
+	fileName: str = args[1]
+	with open(fileName, "r") as configFile:
+		configDict = json.load(configFile)
+
+	try:
+		levelSpecs: List[List[List[int]]] = configDict['levelSpecs']
+		genApproaches: List[str] = configDict['generators']
+		(firstSeed, endSeed) = configDict['seeds']
+		outputDir: str = configDict['outputDir']
+	except (KeyError, ValueError):
+		print('Missing or invalid configuration keys.')
+		usage()
+	shardSize: int = configDict.get('shardSize', 1000)
+	workerNum: int = configDict.get('workers', None)
+
+	# check every generator can run here before any work is submitted, rather than failing in a worker after other
+	# shards are already written
+	genSelector: GeneratorSelector = GeneratorSelector()
+	for genApproach in genApproaches:
+		generator: MazeGenerator = genSelector.construct(genApproach)
+		if generator == None:
+			print('{} is an unknown generator approach.'.format(genApproach))
+			usage()
+		try:
+			generator.checkAvailable()
+		except ImportError as error:
+			print(error)
+			sys.exit(1)
+
+	# every maze to generate, in a fixed order, so shard numbers stay the same when the run is resumed
+	jobs: List[Tuple[int, List[List[int]], str, int]] = [(specNum, levelSpec, genApproach, randSeed)
+		for (specNum, levelSpec) in enumerate(levelSpecs) for genApproach in genApproaches
+		for randSeed in range(firstSeed, endSeed)]
+	shardJobs: List[List[Tuple[int, List[List[int]], str, int]]] = [jobs[start:start + shardSize]
+		for start in range(0, len(jobs), shardSize)]
+
+	# skip shards completed by an earlier run
+	os.makedirs(outputDir, exist_ok=True)
+	pending: List[int] = [shardNum for shardNum in range(len(shardJobs))
+		if not os.path.exists(os.path.join(outputDir, SHARD_INDEX_FILE.format(shardNum)))]
+	print(f'{len(shardJobs) - len(pending)} of {len(shardJobs)} shards already done, generating {len(pending)}.')
+
+	# timer for generation
+	startTime: float = time.perf_counter()
+
+	mazeNum: int = 0
+	workerBusy: dict[int, float] = dict()
+	with ProcessPoolExecutor(max_workers=workerNum) as executor:
+		futures = [executor.submit(generateShard, shardNum, shardJobs[shardNum], outputDir) for shardNum in pending]
+		for future in futures:
+			(shardNum, shardMazeNum, busyTime, pid) = future.result()
+			mazeNum += shardMazeNum
+			workerBusy[pid] = workerBusy.get(pid, 0.0) + busyTime
+
+	# stop timer
+	elapsed: float = time.perf_counter() - startTime
+
+	# index of the whole corpus, collected from the shard indices
+	corpusIndex: dict = {'levelSpecs': levelSpecs, 'shards': [
+		{'file': SHARD_FILE.format(shardNum), 'mazes': readJson(os.path.join(outputDir, SHARD_INDEX_FILE.format(shardNum)))}
+		for shardNum in range(len(shardJobs))]}
+	writeJson(os.path.join(outputDir, CORPUS_INDEX_FILE), corpusIndex)
+
+	print(f'Generated {mazeNum} mazes in {elapsed:0.4f} seconds, {mazeNum / elapsed if elapsed > 0 else 0:0.1f} mazes per second.')
+	for (workerIndex, (pid, busyTime)) in enumerate(sorted(workerBusy.items())):
+		print(f'Worker {workerIndex} (pid {pid}) was busy {busyTime:0.4f} seconds, {100 * busyTime / elapsed:0.1f}% utilisation.')
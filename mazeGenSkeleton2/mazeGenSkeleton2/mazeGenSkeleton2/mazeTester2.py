@@ -9,6 +9,7 @@
 
 
 import sys
+import os
 import time
 import json
 import random
@@ -22,6 +23,8 @@ from generation.mazeGenerator import MazeGenerator
 
 from maze.util import Coordinates3D
 from maze.maze3D import Maze3D
+from maze.mazeCache import MazeCache
+from maze.mazeRandom import MazeRandom
 
 
 
@@ -94,6 +97,23 @@ if __name__ == '__main__':
 		randSeed: int = None
 		if 'randSeed' in configDict.keys():
 			randSeed = configDict['randSeed']
+		# Optional: Graph implementation to store the maze in (see Maze3D.GRAPH_TYPES)
+		graphType: str = 'adjList'
+		if 'graph' in configDict.keys():
+			graphType = configDict['graph']
+		# Optional: File to load the maze from, instead of generating it.  If the file doesn't exist yet, the
+		# generated maze is saved to it, so later runs can skip generation.
+		mazeFile: str = None
+		if 'mazeFile' in configDict.keys():
+			mazeFile = configDict['mazeFile']
+		# Optional: Directory of the cache of generated mazes, and its size cap in bytes.  Only used if randSeed is set,
+		# as otherwise the generated maze isn't determined by the configuration.
+		cacheDir: str = None
+		if 'cacheDir' in configDict.keys():
+			cacheDir = configDict['cacheDir']
+		cacheMaxBytes: int = 1 << 30
+		if 'cacheMaxBytes' in configDict.keys():
+			cacheMaxBytes = configDict['cacheMaxBytes']
 
 
 		# initialise the random seed generator 
@@ -104,7 +124,11 @@ if __name__ == '__main__':
 		#
 		# Initialise maze object.
 		#
-		maze: Maze3D = Maze3D(levelSpecs)
+		if graphType not in Maze3D.GRAPH_TYPES:
+			print('{} is an unknown graph implementation.'.format(graphType))
+			usage()
+
+		maze: Maze3D = Maze3D(levelSpecs, graphType)
 
 		# Store the entrances and exits.
 		for [l,r,c] in entrances:
@@ -146,25 +170,82 @@ if __name__ == '__main__':
 				print('{} is an unknown generator approach.'.format(genApproach))
 				usage()
 
+		# give the generator and solver their own random streams, so they don't depend on each other's draws
+		if randSeed != None:
+			generator.setRandom(MazeRandom(randSeed, ('generator',)))
+			solver.setRandom(MazeRandom(randSeed, ('solver',)))
+
 
 
 		#
-		# Generate maze.
+		# Generate maze, or load it if it has been stored.
 		#
+		mazeLoaded: bool = False
+
+		if mazeFile != None and os.path.exists(mazeFile):
+			# timer for loading
+			startLoadTime : float = time.perf_counter()
+
+			# stored maze already has its entrances and exits carved.  Unless a graph implementation is specified,
+			# use the implicit one, which maps the walls straight from the file.
+			maze = Maze3D.load(mazeFile, graphType=graphType if 'graph' in configDict.keys() else 'implicit')
+			mazeLoaded = True
+
+			# stop timer
+			endLoadTime: float = time.perf_counter()
+
+			print(f'Loading maze from {mazeFile} took {endLoadTime - startLoadTime:0.4f} seconds')
+		else:
+			# check whether the same maze has been generated before.
+			# For Task D, the generator depends on the solver, so that is part of the key.
+			mazeCache: MazeCache = None
+			cacheKey: str = None
+			if cacheDir != None and randSeed != None:
+				mazeCache = MazeCache(cacheDir, cacheMaxBytes)
+				cacheGenName: str = genApproach if genApproach != 'taskD' else 'taskD:' + solverApproach
+				cacheKey = mazeCache.key(levelSpecs, entrances, exits, cacheGenName, randSeed)
+
+				# timer for loading
+				startLoadTime : float = time.perf_counter()
+
+				cachedMaze: Maze3D = mazeCache.load(cacheKey, graphType if 'graph' in configDict.keys() else 'implicit')
+
+				# stop timer
+				endLoadTime: float = time.perf_counter()
+
+				if cachedMaze != None:
+					maze = cachedMaze
+					mazeLoaded = True
+					print(f'Maze cache hit, loading took {endLoadTime - startLoadTime:0.4f} seconds')
+
+			if not mazeLoaded:
+				# timer for generation
+				startGenTime : float = time.perf_counter()
+
+				generator.generateMaze(maze)
+
+				# stop timer
+				endGenTime: float = time.perf_counter()
 
-		# timer for generation
-		startGenTime : float = time.perf_counter()
+				if mazeCache != None:
+					print(f'Generation took {endGenTime - startGenTime:0.4f} seconds (maze cache miss)')
+				else:
+					print(f'Generation took {endGenTime - startGenTime:0.4f} seconds')
 
-		generator.generateMaze(maze)
+				# carve out the entrances and exits
+				maze.carveEntrances()
+				maze.carveExits()
 
-		# stop timer
-		endGenTime: float = time.perf_counter()
+				if generator.isMazeGenerated():
+					maze.setGenerationInfo(genApproach, randSeed)
+					if mazeCache != None:
+						mazeCache.store(cacheKey, maze)
 
-		print(f'Generation took {endGenTime - startGenTime:0.4f} seconds')
+			# store the maze for later runs
+			if mazeFile != None and (mazeLoaded or generator.isMazeGenerated()):
+				maze.save(mazeFile)
 
-		# carve out the entrances and exits
-		maze.carveEntrances()
-		maze.carveExits()
+		mazeReady: bool = mazeLoaded or generator.isMazeGenerated()
 
 
 
@@ -178,7 +259,7 @@ if __name__ == '__main__':
 			print("Specified index of entrance that solver starts is out of bounds, {}".format(solverEntIndex))
 			usage()
 
-		if generator.isMazeGenerated():
+		if mazeReady:
 			# time for solving
 			startSolveTime : float = time.perf_counter()
 
@@ -202,7 +283,7 @@ if __name__ == '__main__':
 		#
 		# Display maze.
 		#
-		if bVisualise and canVisualise and generator.isMazeGenerated():
+		if bVisualise and canVisualise and mazeReady:
 			cellSize = 1
 			visualiser = Visualizer(maze, solver, cellSize) 
 			if outFilename == None:
@@ -12,6 +12,8 @@ from solving.recurBackMazeSolver import RecurBackMazeSolver
 from solving.wallFollowingSolver import WallFollowingMazeSolver
 from solving.pledgeSolver import PledgeMazeSolver
 from solving.taskCMazeSolver import TaskCMazeSolver
+from solving.aStarSolver import AStarMazeSolver
+from solving.biBfsSolver import BiBfsMazeSolver
 from solving.mazeSolver import MazeSolver
 
 
@@ -40,6 +42,10 @@ class SolverSelector:
             solver = PledgeMazeSolver()
         elif solverApproach == 'taskC':
             solver = TaskCMazeSolver()
+        elif solverApproach == 'astar':
+            solver = AStarMazeSolver()
+        elif solverApproach == 'bibfs':
+            solver = BiBfsMazeSolver()
         # TODO: If you implement other solvers, you can add them here
 
         return solver
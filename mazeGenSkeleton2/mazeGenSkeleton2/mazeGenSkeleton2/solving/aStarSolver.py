@@ -0,0 +1,98 @@
+# -------------------------------------------------------------------
+# A* shortest path maze solver.
+#
+# __copyright__ = 'Copyright 2024, RMIT University'
+# -------------------------------------------------------------------
+
+import heapq
+from typing import List, Tuple
+
+from maze.maze3D import Maze3D
+from maze.gridLayout import GridLayout
+from maze.util import Coordinates3D
+from solving.indexedSolver import IndexedMazeSolver
+
+
+class AStarMazeSolver(IndexedMazeSolver):
+    """
+    A* solver.  Cells are expanded in order of the number of moves from the entrance plus an estimate of the number
+    of moves still needed to the nearest exit, kept in a binary heap.  The estimate is the Manhattan distance within a
+    level plus a weighted number of level changes, and with the default weight of 1 it never overestimates, so the
+    path found is a shortest one.  Larger weights head for the exit's level more eagerly, exploring fewer cells, but
+    the path is then no longer guaranteed to be shortest.
+
+    Distances and parent links are kept in flat arrays indexed by GridLayout index.  Every expanded cell counts as
+    explored, in the order it was expanded.
+    """
+
+    def __init__(self, levelWeight: float = 1.0):
+        """
+        Constructor.
+
+        @param levelWeight: Estimated number of moves for each level between a cell and an exit.  Default is 1.
+        """
+        super().__init__()
+        self.m_name = "astar"
+        self.m_levelWeight: float = levelWeight
+
+
+
+    def solveMaze(self, maze: Maze3D, entrance: Coordinates3D):
+        layout: GridLayout = self.resetSolver(maze)
+        size: int = layout.size()
+
+        exits: List[Tuple[int, int, int]] = [(ext.getLevel(), ext.getRow(), ext.getCol()) for ext in maze.getExits()]
+        isExit: bytearray = bytearray(size)
+        for ext in maze.getExits():
+            isExit[layout.coordIndex(ext)] = 1
+
+        # moves from the entrance along the best path found so far, and the cell that path came from
+        gScores = self.newArray(layout)
+        parents = self.newArray(layout)
+        closed: bytearray = bytearray(size)
+
+        startIndex: int = layout.coordIndex(entrance)
+        gScores[startIndex] = 0
+        startEstimate: float = self.estimate(entrance, exits)
+        # (f-score, estimate, index), ties are broken towards the cell closer to an exit
+        openSet: List[Tuple[float, float, int]] = [(startEstimate, startEstimate, startIndex)]
+
+        while len(openSet) > 0:
+            (_, _, index) = heapq.heappop(openSet)
+            # cells can be pushed more than once, only the first pop counts
+            if closed[index]:
+                continue
+            closed[index] = 1
+
+            cell: Coordinates3D = layout.coordinates(index)
+            self.solverPathAppend(cell, False)
+
+            if isExit[index]:
+                self.m_path = self.tracePath(layout, parents, index)
+                self.solved(entrance, cell)
+                return
+
+            gScore: int = gScores[index] + 1
+            for neigh in maze.passableNeighbours(cell):
+                neighIndex: int = layout.coordIndex(neigh)
+                if closed[neighIndex]:
+                    continue
+                if gScores[neighIndex] < 0 or gScore < gScores[neighIndex]:
+                    gScores[neighIndex] = gScore
+                    parents[neighIndex] = index
+                    estimate: float = self.estimate(neigh, exits)
+                    heapq.heappush(openSet, (gScore + estimate, estimate, neighIndex))
+
+
+
+    def estimate(self, cell: Coordinates3D, exits: List[Tuple[int, int, int]])->float:
+        """
+        @param cell: Cell to estimate from.
+        @param exits: (level, row, column) of every exit.
+
+        @returns Estimated number of moves from cell to the nearest exit.
+        """
+        (level, row, col) = (cell.getLevel(), cell.getRow(), cell.getCol())
+
+        return min([abs(row - exitRow) + abs(col - exitCol) + self.m_levelWeight * abs(level - exitLevel)
+                    for (exitLevel, exitRow, exitCol) in exits], default=0)
@@ -0,0 +1,115 @@
+# -------------------------------------------------------------------
+# Bidirectional breadth first search maze solver.
+#
+# __copyright__ = 'Copyright 2024, RMIT University'
+# -------------------------------------------------------------------
+
+from array import array
+from typing import List, Tuple
+
+from maze.maze3D import Maze3D
+from maze.gridLayout import GridLayout
+from maze.util import Coordinates3D
+from solving.indexedSolver import IndexedMazeSolver
+
+
+class BiBfsMazeSolver(IndexedMazeSolver):
+    """
+    Bidirectional breadth first search solver.  One search starts from the entrance, the other from all exits at
+    once, as a single frontier.  The searches take turns expanding a whole layer of their frontier, the one with the
+    smaller frontier going next, and stop once they meet.  Each search then only reaches about half the distance
+    between entrance and exit, which on open mazes touches far fewer cells than a search from the entrance alone.
+    The path found is a shortest one from the entrance to the nearest exit.
+
+    Distances and parent links of both searches are kept in flat arrays indexed by GridLayout index.  Every expanded
+    cell, of either search, counts as explored, in the order it was expanded.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.m_name = "bibfs"
+
+
+
+    def solveMaze(self, maze: Maze3D, entrance: Coordinates3D):
+        layout: GridLayout = self.resetSolver(maze)
+
+        # distances from the entrance/nearest exit, and the cell each cell was reached from by that search
+        forwardDists: array = self.newArray(layout)
+        forwardParents: array = self.newArray(layout)
+        backwardDists: array = self.newArray(layout)
+        backwardParents: array = self.newArray(layout)
+
+        startIndex: int = layout.coordIndex(entrance)
+        forwardDists[startIndex] = 0
+        forwardFrontier: List[int] = [startIndex]
+        backwardFrontier: List[int] = list()
+        for ext in maze.getExits():
+            exitIndex: int = layout.coordIndex(ext)
+            if backwardDists[exitIndex] < 0:
+                backwardDists[exitIndex] = 0
+                backwardFrontier.append(exitIndex)
+
+        # cell where the shortest path found so far crosses from one search to the other
+        meetIndex: int = startIndex if backwardDists[startIndex] == 0 else -1
+
+        while meetIndex < 0 and len(forwardFrontier) > 0 and len(backwardFrontier) > 0:
+            if len(forwardFrontier) <= len(backwardFrontier):
+                (forwardFrontier, meetIndex) = self.expandLayer(maze, layout, forwardFrontier, forwardDists,
+                                                                forwardParents, backwardDists)
+            else:
+                (backwardFrontier, meetIndex) = self.expandLayer(maze, layout, backwardFrontier, backwardDists,
+                                                                 backwardParents, forwardDists)
+
+        if meetIndex < 0:
+            return
+
+        # entrance to the meeting cell, then on to the exit the backward search came from
+        path: List[Coordinates3D] = self.tracePath(layout, forwardParents, meetIndex)
+        index: int = backwardParents[meetIndex]
+        while index >= 0:
+            path.append(layout.coordinates(index))
+            index = backwardParents[index]
+
+        self.m_path = path
+        self.solved(entrance, path[-1])
+
+
+
+    def expandLayer(self, maze: Maze3D, layout: GridLayout, frontier: List[int], dists: array, parents: array,
+                    otherDists: array)->Tuple[List[int], int]:
+        """
+        Expands every cell of one search's frontier.
+
+        @param maze: Maze being solved.
+        @param layout: Layout of the maze's vertices.
+        @param frontier: Indices of the cells to expand, all at the same distance.
+        @param dists: Distances of the search, updated for newly reached cells.
+        @param parents: Parent links of the search, updated for newly reached cells.
+        @param otherDists: Distances of the other search.
+
+        @returns (next frontier, index of the cell where the searches meet on a shortest path through this layer,
+            or -1 if they don't meet yet).
+        """
+        nextFrontier: List[int] = list()
+        meetIndex: int = -1
+        meetLength: int = -1
+
+        for index in frontier:
+            cell: Coordinates3D = layout.coordinates(index)
+            self.solverPathAppend(cell, False)
+
+            dist: int = dists[index] + 1
+            for neighIndex in self.passableIndices(maze, layout, cell):
+                if dists[neighIndex] >= 0:
+                    continue
+                dists[neighIndex] = dist
+                parents[neighIndex] = index
+                nextFrontier.append(neighIndex)
+
+                # the whole layer is expanded before stopping, as a later cell of it might meet on a shorter path
+                if otherDists[neighIndex] >= 0 and (meetIndex < 0 or dist + otherDists[neighIndex] < meetLength):
+                    meetIndex = neighIndex
+                    meetLength = dist + otherDists[neighIndex]
+
+        return (nextFrontier, meetIndex)
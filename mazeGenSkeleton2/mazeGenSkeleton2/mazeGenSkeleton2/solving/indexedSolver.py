@@ -0,0 +1,95 @@
+# -------------------------------------------------------------------
+# Base class for solvers that keep their per cell state in flat arrays.
+#
+# __copyright__ = 'Copyright 2024, RMIT University'
+# -------------------------------------------------------------------
+
+from array import array
+from typing import List
+
+from maze.maze3D import Maze3D
+from maze.gridLayout import GridLayout
+from maze.util import Coordinates3D
+from solving.mazeSolver import MazeSolver
+
+
+class IndexedMazeSolver(MazeSolver):
+    """
+    Base class for solvers that find an actual path from an entrance to an exit, rather than just reaching the exit.
+    Cells are identified by their index in the maze's GridLayout, so per cell state such as distances and parent
+    links is kept in flat arrays, rather than in dictionaries or sets of Coordinates3D.  The path found is available
+    from getPath() once solved.
+    """
+
+    def __init__(self):
+        super().__init__()
+        # self.m_path: Cells of the path found, from the entrance to the exit.  Empty if not solved.
+        self.m_path: List[Coordinates3D] = list()
+
+
+
+    def resetSolver(self, maze: Maze3D)->GridLayout:
+        """
+        Resets the solver before solving, including the path, and the cells explored and solver path.
+
+        @param maze: Maze about to be solved.
+
+        @returns Layout of the maze's vertices, to index the arrays with.
+        """
+        self.m_solved = False
+        self.m_entranceUsed = None
+        self.m_exitUsed = None
+        self.m_path = list()
+        self.resetPathAndCellExplored()
+
+        return maze.layout()
+
+
+
+    def newArray(self, layout: GridLayout, value: int = -1)->array:
+        """
+        @param layout: Layout of the maze's vertices.
+        @param value: Initial value of every entry.  Default is -1, i.e., none.
+
+        @returns Array with an entry for every vertex of the layout.
+        """
+        return array('l', [value]) * layout.size()
+
+
+
+    def passableIndices(self, maze: Maze3D, layout: GridLayout, cell: Coordinates3D)->List[int]:
+        """
+        @param maze: Maze being solved.
+        @param layout: Layout of the maze's vertices.
+        @param cell: Cell we want to move from.
+
+        @returns Indices of the neighbours of cell that can be moved to, see Maze3D.passableNeighbours().
+        """
+        return [layout.coordIndex(neigh) for neigh in maze.passableNeighbours(cell)]
+
+
+
+    def tracePath(self, layout: GridLayout, parents: array, index: int)->List[Coordinates3D]:
+        """
+        @param layout: Layout of the maze's vertices.
+        @param parents: Index of the cell each cell was reached from, or -1 for the cell(s) the search started at.
+        @param index: Index of the cell to trace back from.
+
+        @returns Cells from the start of the search to the cell at index, following the parent links.
+        """
+        path: List[Coordinates3D] = list()
+        while index >= 0:
+            path.append(layout.coordinates(index))
+            index = parents[index]
+        path.reverse()
+
+        return path
+
+
+
+    def getPath(self)->List[Coordinates3D]:
+        """
+        @return The path found from the entrance to the exit, without any cells that were only explored.  Should only
+            be called after a solution is found.
+        """
+        return self.m_path
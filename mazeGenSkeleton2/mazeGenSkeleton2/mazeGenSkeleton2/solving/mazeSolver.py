@@ -9,6 +9,7 @@
 from typing import List, Tuple
 from maze.maze3D import Maze3D
 from maze.util import Coordinates3D
+from maze.mazeRandom import MazeRandom
 
 
 class MazeSolver:
@@ -26,6 +27,8 @@ class MazeSolver:
         self.m_exitUsed = None
         # name of the solver
         self.m_name = ""
+        # self.m_rng: Random stream of the solver, see rng().
+        self.m_rng: MazeRandom = None
 
 
 
@@ -52,6 +55,28 @@ class MazeSolver:
 
 
 
+    def setRandom(self, rng: MazeRandom):
+        """
+        Sets the random stream this solver draws from, e.g., MazeRandom(randSeed, ('solver',)).
+
+        @param rng: Random stream to use.
+        """
+        self.m_rng = rng
+
+
+
+    def rng(self)->MazeRandom:
+        """
+        @returns Random stream of this solver.  If none has been set, one is seeded from the global random module, so
+            solving still follows random.seed().
+        """
+        if self.m_rng is None:
+            self.m_rng = MazeRandom()
+
+        return self.m_rng
+
+
+
     def solved(self, entrance: Coordinates3D, exit: Coordinates3D):
         """
         If solver has solved the maze, call this method with the entrance and exit to update the solver about this.
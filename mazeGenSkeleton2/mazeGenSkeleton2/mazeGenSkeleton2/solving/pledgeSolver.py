@@ -120,8 +120,5 @@ class PledgeMazeSolver(MazeSolver):
         # Check if the coordinates are valid within the maze
         if not maze.checkCoordinates(next):
             return False
-        # Check if there's no wall between current and next
-        for neighbor, has_wall in maze.m_graph.m_vertListMap.get(current, []):
-            if neighbor == next and not has_wall:
-                return True
-        return False
+        # Check if next is adjacent to current and there's no wall between them
+        return next in maze.passableNeighbours(current)
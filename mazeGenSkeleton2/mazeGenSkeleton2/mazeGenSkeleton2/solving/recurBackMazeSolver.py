@@ -6,7 +6,6 @@
 # __copyright__ = 'Copyright 2024, RMIT University'
 # -------------------------------------------------------------------
 
-from random import choice
 from collections import deque
 
 from maze.maze3D import Maze3D
@@ -41,18 +40,18 @@ class RecurBackMazeSolver(MazeSolver):
 
     
         while currCell not in maze.getExits():
-			# find all neighbours of current cell
-            neighbours : list[Coordinates3D] = maze.neighbours(currCell)
+			# find all neighbours of current cell that don't have a wall between them
+            neighbours : tuple[Coordinates3D, ...] = maze.passableNeighbours(currCell)
 
-			# filter to ones that haven't been visited and within boundary and doesn't have a wall between them	
-            nonVisitedNeighs : list[Coordinates3D] = [neigh for neigh in neighbours if neigh not in visited and not maze.hasWall(currCell,neigh) and\
+			# filter to ones that haven't been visited and within boundary
+            nonVisitedNeighs : list[Coordinates3D] = [neigh for neigh in neighbours if neigh not in visited and\
 											 (neigh.getRow() >= -1) and (neigh.getRow() <= maze.rowNum(neigh.getLevel())) and\
 												(neigh.getCol() >= -1) and (neigh.getCol() <= maze.colNum(neigh.getLevel()))]
 
 			# see if any unvisited neighbours
             if len(nonVisitedNeighs) > 0:
 				# randomly select one of them
-                neigh = choice(nonVisitedNeighs)
+                neigh = self.rng().choice(nonVisitedNeighs)
 
 				# add to stack
                 stack.append(neigh)
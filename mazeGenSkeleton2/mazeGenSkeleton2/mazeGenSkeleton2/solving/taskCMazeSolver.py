@@ -1,16 +1,29 @@
+from array import array
+from typing import List, Tuple
+
 from maze.maze3D import Maze3D
-from solving.mazeSolver import MazeSolver
+from maze.gridLayout import GridLayout
 from maze.util import Coordinates3D
-from collections import deque
+from solving.indexedSolver import IndexedMazeSolver
 
-class TaskCMazeSolver(MazeSolver):
+class TaskCMazeSolver(IndexedMazeSolver):
     """
-    Task C solver implementation. You'll need to complete its implementation for task C.
+    Task C solver implementation.  Finds the entrance and exit pair with the shortest path between them.
+
+    A breadth first search is run from every exit, or from every entrance if there are fewer of those, with the
+    parent links in a flat array, stopping once it has reached all endpoints on the other side.  Together they give
+    the distance between every entrance and exit, see getDistanceTable(), in O(cells x searches).  Picking the best
+    pair is then a lookup in the table, and its path is traced once, from the parent links of the search that found
+    it.  A cell expanded by several searches counts as explored once, and only the chosen path goes in the solver
+    path, so the visualisation shows that path rather than every search.
     """
 
     def __init__(self):
         super().__init__()
         self.m_name = "taskC"
+        # self.m_distanceTable: distanceTable[i][j] is the number of moves from entrance i to exit j, or None if there
+        # is no path.
+        self.m_distanceTable: List[List[int]] = list()
 
     def solveMaze(self, maze: Maze3D, entry_point: Coordinates3D = None):
         # We call the solve maze without the entrance for task C
@@ -21,87 +34,99 @@ class TaskCMazeSolver(MazeSolver):
         Solve the maze, used by Task C.
         This version of solveMaze does not provide a starting entrance, and as part of the solution, the method should
         find the entrance and exit pair (see project specs for requirements of this task).
-        """
-        entry_points = maze.getEntrances()
-        exit_points = maze.getExits()
-
-        if not entry_points:
-            print("No entry points found in the maze.")
-            return
 
-        if not exit_points:
-            print("No exit points found in the maze.")
+        @param maze: Instance of maze to solve.
+        """
+        layout: GridLayout = self.resetSolver(maze)
+        entrances: List[Coordinates3D] = maze.getEntrances()
+        exits: List[Coordinates3D] = maze.getExits()
+        self.m_distanceTable = [[None] * len(exits) for _ in entrances]
+
+        # search from the side with fewer endpoints, both give the whole table
+        fromExits: bool = len(exits) <= len(entrances)
+        (sources, targets) = (exits, entrances) if fromExits else (entrances, exits)
+
+        # cells expanded by any of the searches, each counted as explored once
+        explored: bytearray = bytearray(layout.size())
+
+        bestDist: int = -1
+        bestParents: array = None
+        bestPair: Tuple[int, int] = None
+        for (sourceNum, source) in enumerate(sources):
+            (dists, parents) = self.searchFrom(maze, layout, source, targets, explored)
+
+            for (targetNum, target) in enumerate(targets):
+                dist: int = dists[layout.coordIndex(target)]
+                if dist < 0:
+                    continue
+                (entranceNum, exitNum) = (targetNum, sourceNum) if fromExits else (sourceNum, targetNum)
+                self.m_distanceTable[entranceNum][exitNum] = dist
+                if bestDist < 0 or dist < bestDist:
+                    (bestDist, bestParents, bestPair) = (dist, parents, (entranceNum, exitNum))
+
+        if bestDist < 0:
             return
 
-        print(f"Entry points: {entry_points}")
-        print(f"Exit points: {exit_points}")
-
-        # Initialize variables for the best path and cost
-        optimal_path = None
-        optimal_cost = float('inf')
-        optimal_entry = None
-        optimal_exit = None
-
-        # Explore from each entry point to find all exit points and paths
-        for entry in entry_points:
-            bfs_queue = deque([(entry, [entry], 0)])
-            visited_nodes = set([entry])
-            local_optimal_cost = float('inf')
-            local_optimal_path = None
-            local_optimal_exit = None
-
-            print(f"Exploring from entry point: {entry}")
-
-            while bfs_queue:
-                current_node, path, explored_cells = bfs_queue.popleft()
-                self.solverPathAppend(current_node)  # Record each step
-
-                if current_node in exit_points:
-                    current_cost = explored_cells + len(path)
-                    if current_cost < local_optimal_cost:
-                        local_optimal_cost = current_cost
-                        local_optimal_path = path
-                        local_optimal_exit = current_node
-                        print(f"New local optimal path found from {entry} to {current_node} with cost {local_optimal_cost}")
-
-                for neighbor in self.get_neighbors(maze, current_node):
-                    if neighbor not in visited_nodes and not maze.hasWall(current_node, neighbor):
-                        visited_nodes.add(neighbor)
-                        bfs_queue.append((neighbor, path + [neighbor], explored_cells + 1))
-
-            # Update the global optimal path if the local optimal is better
-            if local_optimal_path and local_optimal_cost < optimal_cost:
-                optimal_cost = local_optimal_cost
-                optimal_path = local_optimal_path
-                optimal_entry = entry
-                optimal_exit = local_optimal_exit
-                print(f"New global optimal path found from {optimal_entry} to {optimal_exit} with cost {optimal_cost}")
-
-        if optimal_path:
-            self.solved(optimal_entry, optimal_exit)
-            for cell in optimal_path:
-                self.solverPathAppend(cell)
-            print(f"Optimal path found from {optimal_entry} to {optimal_exit}")
+        (entrance, exit) = (entrances[bestPair[0]], exits[bestPair[1]])
+        if fromExits:
+            # the parent links lead from the entrance back to the exit the search started at
+            self.m_path = self.tracePath(layout, bestParents, layout.coordIndex(entrance))
+            self.m_path.reverse()
         else:
-            print("No path found.")
-
-    def get_neighbors(self, maze, current_position):
-        level = current_position.getLevel()
-        row = current_position.getRow()
-        col = current_position.getCol()
-        neighbors = []
-        directions = [(0, 1, 0), (1, 0, 0), (0, -1, 0), (-1, 0, 0), (0, 0, 1), (0, 0, -1)]
-
-        for direction in directions:
-            neighbor = Coordinates3D(level + direction[0], row + direction[1], col + direction[2])
-            if self.is_within_bounds(neighbor, maze):
-                if maze.checkCoordinates(neighbor):
-                    neighbors.append(neighbor)
-        return neighbors
-
-    def is_within_bounds(self, cell, maze):
-        if 0 <= cell.getLevel() < len(maze.m_levelDims) and \
-           0 <= cell.getRow() < maze.m_levelDims[cell.getLevel()][0] and \
-           0 <= cell.getCol() < maze.m_levelDims[cell.getLevel()][1]:
-            return True
-        return False
+            self.m_path = self.tracePath(layout, bestParents, layout.coordIndex(exit))
+        # the path cells were already counted as explored by the searches
+        for cell in self.m_path:
+            self.m_solverPath.append((cell, False))
+        self.solved(entrance, exit)
+
+    def searchFrom(self, maze: Maze3D, layout: GridLayout, source: Coordinates3D, targets: List[Coordinates3D],
+                   explored: bytearray):
+        """
+        Breadth first search from one endpoint, until all endpoints of the other side have been reached.
+
+        @param maze: Maze being solved.
+        @param layout: Layout of the maze's vertices.
+        @param source: Entrance or exit to search from.
+        @param targets: Exits or entrances, respectively, to search for.
+        @param explored: Flag per GridLayout index, set for cells expanded by earlier searches.  Cells first expanded
+            by this search are flagged, and added to the cells explored.
+
+        @returns (distances, parents) arrays indexed by GridLayout index, with -1 for cells not reached, and for the
+            parent of the source.
+        """
+        dists: array = self.newArray(layout)
+        parents: array = self.newArray(layout)
+
+        remaining: set = set([layout.coordIndex(target) for target in targets])
+        sourceIndex: int = layout.coordIndex(source)
+        dists[sourceIndex] = 0
+        remaining.discard(sourceIndex)
+
+        # the queue is a list with a read position, cells are never removed
+        queue: List[int] = [sourceIndex]
+        position: int = 0
+        while position < len(queue) and len(remaining) > 0:
+            index: int = queue[position]
+            position += 1
+
+            if not explored[index]:
+                explored[index] = 1
+                self.m_cellsExplored += 1
+
+            cell: Coordinates3D = layout.coordinates(index)
+            dist: int = dists[index] + 1
+            for neighIndex in self.passableIndices(maze, layout, cell):
+                if dists[neighIndex] < 0:
+                    dists[neighIndex] = dist
+                    parents[neighIndex] = index
+                    queue.append(neighIndex)
+                    remaining.discard(neighIndex)
+
+        return (dists, parents)
+
+    def getDistanceTable(self)->List[List[int]]:
+        """
+        @return Number of moves between every entrance and exit, indexed as [entrance number][exit number], with None
+            if there is no path.  Should only be called after solving.
+        """
+        return self.m_distanceTable
@@ -61,7 +61,7 @@ class WallFollowingMazeSolver(MazeSolver):
                     break
                 
                 # Check if the move is valid
-                if next_position and next_position not in explored_cells and not maze.hasWall(current_position, next_position):
+                if next_position and next_position not in explored_cells and next_position in maze.passableNeighbours(current_position):
                     position_stack.append(next_position)
                     direction_index = new_direction_index  # Update the facing direction
                     print("Moving from", current_position, "to", next_position, "towards", new_direction)
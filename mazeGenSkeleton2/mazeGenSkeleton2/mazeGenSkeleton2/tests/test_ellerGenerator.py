@@ -0,0 +1,61 @@
+# -------------------------------------------------
+# Tests of streaming rows from Eller's maze generator.
+#
+# __copyright__ = 'Copyright 2024, RMIT University'
+# -------------------------------------------------
+
+
+import itertools
+import unittest
+
+from maze.mazeRandom import MazeRandom
+from generation.ellerGenerator import EllerMazeGenerator
+
+
+class TestEllerGenerator(unittest.TestCase):
+
+    def generator(self)->EllerMazeGenerator:
+        generator: EllerMazeGenerator = EllerMazeGenerator()
+        generator.setRandom(MazeRandom(7, ('generator',)))
+
+        return generator
+
+
+
+    def testTakeRowsFromUnboundedLevel(self):
+        rowNum: int = 50
+        rows = list(itertools.islice(self.generator().rows([(None, 12)]), rowNum))
+
+        self.assertEqual([row for (_, row, _, _, _) in rows], list(range(rowNum)))
+        # the rows before the last row of a bounded level draw the same random numbers
+        bounded = list(self.generator().rows([(rowNum + 1, 12)]))[:rowNum]
+        self.assertEqual(rows, bounded)
+
+
+
+    def testWriteRowsStopsWhenSinkDoes(self):
+        rowNum: int = 30
+        written = list()
+
+        def sink(level, row, eastOpen, northOpen, upCol):
+            written.append((level, row, eastOpen, northOpen, upCol))
+            return len(written) < rowNum
+
+        self.generator().writeRows([(4, 12), (None, 12)], sink)
+
+        self.assertEqual(len(written), rowNum)
+        self.assertEqual([(level, row) for (level, row, _, _, _) in written[:5]],
+                         [(0, 0), (0, 1), (0, 2), (0, 3), (1, 0)])
+        # the passage up from level 0 is in one of its rows
+        self.assertEqual(len([upCol for (level, _, _, _, upCol) in written if level == 0 and upCol >= 0]), 1)
+
+
+
+    def testOnlyLastLevelCanBeUnbounded(self):
+        with self.assertRaises(ValueError):
+            next(self.generator().rows([(None, 12), (4, 12)]))
+
+
+
+if __name__ == '__main__':
+    unittest.main()
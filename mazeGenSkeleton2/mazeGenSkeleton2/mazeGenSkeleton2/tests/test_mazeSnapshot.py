@@ -0,0 +1,84 @@
+# -------------------------------------------------
+# Tests of Maze3D snapshots and forks.
+#
+# __copyright__ = 'Copyright 2024, RMIT University'
+# -------------------------------------------------
+
+
+import unittest
+
+from maze.maze3D import Maze3D
+from maze.mazeRandom import MazeRandom
+from maze.overlayGraph import OverlayGraph
+from maze.util import Coordinates3D
+from generation.primGenerator import PrimMazeGenerator
+
+
+def overlayDepth(maze: Maze3D)->int:
+    """
+    @param maze: Maze to check.
+
+    @returns Number of overlays between the maze and the graph that stores its walls.
+    """
+    depth: int = 0
+    graph = maze.m_graph
+    while isinstance(graph, OverlayGraph):
+        graph = graph.m_base
+        depth += 1
+
+    return depth
+
+
+
+class TestMazeSnapshot(unittest.TestCase):
+
+    def generatedMaze(self, graphType: str)->Maze3D:
+        maze: Maze3D = Maze3D([(5, 5)], graphType)
+        generator: PrimMazeGenerator = PrimMazeGenerator()
+        generator.setRandom(MazeRandom(1, ('generator',)))
+        generator.generateMaze(maze)
+
+        return maze
+
+
+
+    def testRepeatedSnapshotsStayOneOverlayDeep(self):
+        (cell1, cell2) = (Coordinates3D(0, 2, 2), Coordinates3D(0, 2, 3))
+        for graphType in Maze3D.GRAPH_TYPES:
+            with self.subTest(graphType=graphType):
+                maze: Maze3D = self.generatedMaze(graphType)
+                snapshots = list()
+                for _ in range(200):
+                    snapshots.append((maze.snapshot(), maze.hasWall(cell1, cell2)))
+                    if maze.hasWall(cell1, cell2):
+                        maze.removeWall(cell1, cell2)
+                    else:
+                        maze.addWall(cell1, cell2)
+
+                self.assertLessEqual(overlayDepth(maze), 1)
+                self.assertLessEqual(max([overlayDepth(snapshot) for (snapshot, _) in snapshots]), 1)
+                # every snapshot still sees the walls as they were when it was taken
+                for (snapshot, hasWall) in snapshots:
+                    self.assertEqual(snapshot.hasWall(cell1, cell2), hasWall)
+
+
+
+    def testForksOfForksStayOneOverlayDeep(self):
+        (cell1, cell2) = (Coordinates3D(0, 0, 0), Coordinates3D(0, 0, 1))
+        maze: Maze3D = self.generatedMaze('implicit')
+        fork: Maze3D = maze
+        for _ in range(50):
+            fork = fork.fork()
+            if fork.hasWall(cell1, cell2):
+                fork.removeWall(cell1, cell2)
+            else:
+                fork.addWall(cell1, cell2)
+
+        self.assertLessEqual(overlayDepth(fork), 1)
+        self.assertLessEqual(overlayDepth(fork.snapshot().fork()), 1)
+        self.assertEqual(fork.hasWall(cell1, cell2), maze.hasWall(cell1, cell2))
+
+
+
+if __name__ == '__main__':
+    unittest.main()